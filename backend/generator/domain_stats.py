@@ -572,7 +572,9 @@ def compute_all_findings(
     t_stats = time.perf_counter()
     n_dunnett_reused = 0
     n_dunnett_computed = 0
+    domains_seen: set[str] = set()
     for finding in all_findings:
+        domains_seen.add(finding.get("domain"))
         finding["organ_name"] = get_organ_name(
             finding.get("specimen"),
             finding.get("test_code"),
@@ -626,6 +628,7 @@ def compute_all_findings(
 
     dg_data["mi_tissue_inventory"] = mi_tissue_inventory
     dg_data["species"] = species
+    dg_data["domains_seen"] = domains_seen
     return all_findings, dg_data
 
 
@@ -7,7 +7,7 @@ the BW-FW relationship using a 4-way assessment table.
 Pattern follows tumor_summary.py (cross-domain generator module).
 """
 
-import re
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -20,6 +20,12 @@ from services.analysis.statistics import welch_t_test, compute_effect_size
 # Threshold: FW decrease < 10% is "not meaningfully decreased" (within normal variation)
 FW_DECREASE_THRESHOLD = -10.0
 
+# Raw columns consumed downstream -- read_xpt decodes only these
+FW_RAW_COLUMNS = [
+    "USUBJID", "POOLID", "FWTESTCD", "FWSTRESN", "FWORRES", "FWDY", "FWENDY",
+]
+BW_RAW_COLUMNS = ["USUBJID", "BWSTRESN", "BWORRES", "BWDY"]
+
 
 def build_food_consumption_summary(findings: list[dict], study: StudyInfo) -> dict:
     """Build cross-domain food consumption summary from pre-computed findings.
@@ -31,7 +37,7 @@ def build_food_consumption_summary(findings: list[dict], study: StudyInfo) -> di
     fw_findings = [f for f in findings if f.get("domain") == "FW"]
     bw_findings = [f for f in findings if f.get("domain") == "BW"]
 
-    if not fw_findings:
+    if not fw_findings or not _has_fw_and_bw(study):
         return {"available": False}
 
     # Read raw data for per-animal cross-reference
@@ -47,11 +53,11 @@ def build_food_consumption_summary(findings: list[dict], study: StudyInfo) -> di
 
     # Check for water consumption data
     # numpy.bool_ fails identity checks; convert at boundary
-    has_water = bool("FWTESTCD" in fw_df.columns and (fw_df["FWTESTCD"].str.upper() == "WC").any())
+    has_water = bool("FWTESTCD" in fw_df.columns and (fw_df["FWTESTCD"] == "WC").any())
 
     # Filter to food consumption only (exclude water)
     if "FWTESTCD" in fw_df.columns:
-        fw_food = fw_df[fw_df["FWTESTCD"].str.upper() == "FC"].copy()
+        fw_food = fw_df[fw_df["FWTESTCD"] == "FC"].copy()
         if fw_food.empty:
             # Maybe no FWTESTCD column distinction — use all FW data
             fw_food = fw_df.copy()
@@ -79,12 +85,17 @@ def build_food_consumption_summary(findings: list[dict], study: StudyInfo) -> di
     }
 
 
+def _has_fw_and_bw(study: StudyInfo) -> bool:
+    """Both FW and BW XPT files are present (checked before any read)."""
+    return "fw" in study.xpt_files and "bw" in study.xpt_files
+
+
 def _read_fw_raw(study: StudyInfo) -> pd.DataFrame | None:
     """Read raw FW XPT data, resolving POOLID → USUBJID via POOLDEF if needed."""
     if "fw" not in study.xpt_files:
         return None
     try:
-        df, _ = read_xpt(study.xpt_files["fw"])
+        df, _ = read_xpt(study.xpt_files["fw"], columns=FW_RAW_COLUMNS)
         df.columns = [c.upper() for c in df.columns]
         if "FWSTRESN" in df.columns:
             df["value"] = pd.to_numeric(df["FWSTRESN"], errors="coerce")
@@ -92,6 +103,9 @@ def _read_fw_raw(study: StudyInfo) -> pd.DataFrame | None:
             df["value"] = pd.to_numeric(df["FWORRES"], errors="coerce")
         else:
             return None
+        # Normalize test codes once; callers compare against upper-case literals
+        if "FWTESTCD" in df.columns:
+            df["FWTESTCD"] = df["FWTESTCD"].str.upper()
         # Parse day columns
         for col in ["FWDY", "FWENDY"]:
             if col in df.columns:
@@ -101,7 +115,9 @@ def _read_fw_raw(study: StudyInfo) -> pd.DataFrame | None:
             usub_vals = df["USUBJID"].astype(str).str.strip() if "USUBJID" in df.columns else pd.Series(dtype=str)
             has_usub = usub_vals.replace("", pd.NA).replace("nan", pd.NA).notna().any()
             if not has_usub:
-                pool_df, _ = read_xpt(study.xpt_files["pooldef"])
+                pool_df, _ = read_xpt(
+                    study.xpt_files["pooldef"], columns=["USUBJID", "POOLID"],
+                )
                 pool_df.columns = [c.upper() for c in pool_df.columns]
                 if "USUBJID" in pool_df.columns and "POOLID" in pool_df.columns:
                     df = df.drop(columns=["USUBJID"], errors="ignore")
@@ -116,7 +132,7 @@ def _read_bw_raw(study: StudyInfo) -> pd.DataFrame | None:
     if "bw" not in study.xpt_files:
         return None
     try:
-        df, _ = read_xpt(study.xpt_files["bw"])
+        df, _ = read_xpt(study.xpt_files["bw"], columns=BW_RAW_COLUMNS)
         df.columns = [c.upper() for c in df.columns]
         if "BWSTRESN" in df.columns:
             df["value"] = pd.to_numeric(df["BWSTRESN"], errors="coerce")
@@ -136,7 +152,7 @@ def _get_study_route(study: StudyInfo) -> str | None:
     if "ts" not in study.xpt_files:
         return None
     try:
-        ts_df, _ = read_xpt(study.xpt_files["ts"])
+        ts_df, _ = read_xpt(study.xpt_files["ts"], columns=["TSPARMCD", "TSVAL"])
         ts_df.columns = [c.upper() for c in ts_df.columns]
         route_rows = ts_df[ts_df["TSPARMCD"].str.upper() == "ROUTE"]
         if not route_rows.empty:
@@ -168,12 +184,15 @@ def _compute_periods(fw_df: pd.DataFrame, bw_df: pd.DataFrame) -> list[dict]:
     # FW should already have USUBJID; we need dose_level
     if "USUBJID" not in fw_df.columns or "USUBJID" not in bw_df.columns:
         return []
+    # dose_level comes from the caller's DM merge; standalone frames lack it
+    if "dose_level" not in fw_df.columns:
+        return []
 
     # Get dose info - need to look at fw_df's study for dose groups
     # Build subject info from the intersection of FW and BW subjects
-    fw_subjects = set(fw_df["USUBJID"].unique())
-    bw_subjects = set(bw_df["USUBJID"].unique())
-    common_subjects = fw_subjects & bw_subjects
+    common_subjects = frozenset(fw_df["USUBJID"].unique()).intersection(
+        bw_df["USUBJID"].unique()
+    )
 
     if not common_subjects:
         return []
@@ -200,12 +219,9 @@ def _compute_periods(fw_df: pd.DataFrame, bw_df: pd.DataFrame) -> list[dict]:
     else:
         return []
 
-    # Need subjects with dose_level info
-    # Try to get it from the fw_df itself (if already merged)
-    if "dose_level" not in fw_df.columns:
-        # We need to get it from somewhere — this will be handled by the caller
-        # For standalone operation, return empty
-        return []
+    # Restrict both frames to common subjects once, not per period
+    fw_df = fw_df[fw_df["USUBJID"].isin(common_subjects)]
+    bw_df = bw_df[bw_df["USUBJID"].isin(common_subjects)]
 
     periods = []
     for start_day, end_day in sorted(period_list):
@@ -219,61 +235,63 @@ def _compute_periods(fw_df: pd.DataFrame, bw_df: pd.DataFrame) -> list[dict]:
         else:
             period_fw = fw_df[fw_df["FWDY"].between(start_day, end_day)].copy()
 
-        period_fw = period_fw[period_fw["USUBJID"].isin(common_subjects)]
         if period_fw.empty:
             continue
 
         # Get BW at period start and end for each animal
         # Find nearest BW measurement to start_day and end_day
-        bw_start = _nearest_bw(bw_df, start_day, common_subjects)
-        bw_end = _nearest_bw(bw_df, end_day, common_subjects)
-
-        # Per-animal food efficiency
-        animal_fe = []
-        for _, row in period_fw.iterrows():
-            subj = row["USUBJID"]
-            fw_val = row["value"]
-            if pd.isna(fw_val) or fw_val <= 0:
-                continue
-            bw_s = bw_start.get(subj)
-            bw_e = bw_end.get(subj)
-            if bw_s is None or bw_e is None or pd.isna(bw_s) or pd.isna(bw_e):
-                continue
-            bw_gain = float(bw_e) - float(bw_s)
-            total_food = float(fw_val) * days_in_period
-            if total_food > 0:
-                fe = bw_gain / total_food
-                animal_fe.append({
-                    "USUBJID": subj,
-                    "dose_level": int(row["dose_level"]),
-                    "sex": str(row.get("SEX", "U")),
-                    "fw_g_per_day": float(fw_val),
-                    "bw_gain": bw_gain,
-                    "food_efficiency": fe,
-                })
-
-        if not animal_fe:
+        bw_start = _nearest_bw(bw_df, start_day)
+        bw_end = _nearest_bw(bw_df, end_day)
+
+        # Per-animal food efficiency, computed column-wise: an animal needs
+        # positive FW and BW at both period ends
+        fw_vals = period_fw["value"].to_numpy(dtype=float)
+        bw_s = period_fw["USUBJID"].map(bw_start).to_numpy(dtype=float)
+        bw_e = period_fw["USUBJID"].map(bw_end).to_numpy(dtype=float)
+        valid = (fw_vals > 0) & ~np.isnan(bw_s) & ~np.isnan(bw_e)
+        if not valid.any():
             continue
 
-        fe_df = pd.DataFrame(animal_fe)
+        bw_gain = bw_e[valid] - bw_s[valid]
+        total_food = fw_vals[valid] * days_in_period
+        sex_col = period_fw["SEX"].astype(str) if "SEX" in period_fw.columns else "U"
+        fe_df = pd.DataFrame({
+            "USUBJID": period_fw["USUBJID"],
+            "dose_level": period_fw["dose_level"].astype(int),
+            "sex": sex_col,
+        })[valid]
+        fe_df["fw_g_per_day"] = fw_vals[valid]
+        fe_df["bw_gain"] = bw_gain
+        fe_df["food_efficiency"] = bw_gain / total_food
 
         # Aggregate by dose_level + sex
         by_dose_sex = []
         control_fe_values = {}  # sex -> values
-
-        for (dose_level, sex), grp in fe_df.groupby(["dose_level", "sex"]):
-            fe_vals = grp["food_efficiency"].values
-            fw_vals = grp["fw_g_per_day"].values
-            bw_vals = grp["bw_gain"].values
-
+        control_entries = {}  # sex -> control entry
+
+        # One Cython groupby pass for all per-cell aggregates; the per-cell
+        # FE vectors for the Welch tests come from the same grouping
+        grouped = fe_df.groupby(["dose_level", "sex"])
+        fe_all = fe_df["food_efficiency"].to_numpy()
+        cell_fe = {key: fe_all[pos] for key, pos in grouped.indices.items()}
+        cell_stats = grouped.agg(
+            n=("food_efficiency", "size"),
+            mean_fw=("fw_g_per_day", "mean"),
+            mean_bw_gain=("bw_gain", "mean"),
+            mean_fe=("food_efficiency", "mean"),
+            sd_fe=("food_efficiency", "std"),
+        )
+
+        for row in cell_stats.itertuples():
+            dose_level, sex = row.Index
             entry = {
                 "dose_level": int(dose_level),
                 "sex": str(sex),
-                "n": int(len(grp)),
-                "mean_fw": round(float(np.mean(fw_vals)), 2),
-                "mean_bw_gain": round(float(np.mean(bw_vals)), 2),
-                "mean_food_efficiency": round(float(np.mean(fe_vals)), 4),
-                "food_efficiency_sd": round(float(np.std(fe_vals, ddof=1)), 4) if len(fe_vals) > 1 else None,
+                "n": int(row.n),
+                "mean_fw": round(float(row.mean_fw), 2),
+                "mean_bw_gain": round(float(row.mean_bw_gain), 2),
+                "mean_food_efficiency": round(float(row.mean_fe), 4),
+                "food_efficiency_sd": round(float(row.sd_fe), 4) if row.n > 1 else None,
                 "food_efficiency_control": None,
                 "food_efficiency_reduced": None,
                 "fe_p_value": None,
@@ -282,13 +300,15 @@ def _compute_periods(fw_df: pd.DataFrame, bw_df: pd.DataFrame) -> list[dict]:
                 "bw_pct_change": None,
             }
 
+            entry_fe = cell_fe[row.Index]
             if dose_level == 0:
-                control_fe_values[str(sex)] = fe_vals
+                control_fe_values[str(sex)] = entry_fe
+                control_entries[str(sex)] = entry
 
-            by_dose_sex.append(entry)
+            by_dose_sex.append((entry, entry_fe))
 
         # Compute vs-control stats
-        for entry in by_dose_sex:
+        for entry, dose_fe in by_dose_sex:
             sex = entry["sex"]
             ctrl_vals = control_fe_values.get(sex)
             if ctrl_vals is not None and len(ctrl_vals) > 0:
@@ -301,10 +321,7 @@ def _compute_periods(fw_df: pd.DataFrame, bw_df: pd.DataFrame) -> list[dict]:
                     entry["food_efficiency_reduced"] = False
                 else:
                     # Compute pct change vs control
-                    ctrl_fw_entry = next(
-                        (e for e in by_dose_sex if e["dose_level"] == 0 and e["sex"] == sex),
-                        None,
-                    )
+                    ctrl_fw_entry = control_entries.get(sex)
                     if ctrl_fw_entry and ctrl_fw_entry["mean_fw"] > 0:
                         entry["fw_pct_change"] = round(
                             ((entry["mean_fw"] - ctrl_fw_entry["mean_fw"]) / ctrl_fw_entry["mean_fw"]) * 100, 1
@@ -321,10 +338,6 @@ def _compute_periods(fw_df: pd.DataFrame, bw_df: pd.DataFrame) -> list[dict]:
                         )
 
                     # Welch t-test on FE values vs control
-                    dose_fe = fe_df[
-                        (fe_df["dose_level"] == entry["dose_level"]) &
-                        (fe_df["sex"] == sex)
-                    ]["food_efficiency"].values
                     if len(dose_fe) >= 2 and len(ctrl_vals) >= 2:
                         t_result = welch_t_test(dose_fe, ctrl_vals)
                         d_result = compute_effect_size(dose_fe, ctrl_vals)
@@ -335,23 +348,48 @@ def _compute_periods(fw_df: pd.DataFrame, bw_df: pd.DataFrame) -> list[dict]:
             "start_day": start_day,
             "end_day": end_day,
             "days": days_in_period,
-            "by_dose_sex": by_dose_sex,
+            "by_dose_sex": [entry for entry, _ in by_dose_sex],
         })
 
     return periods
 
 
-def _nearest_bw(bw_df: pd.DataFrame, target_day: int, subjects: set) -> dict[str, float]:
-    """Find nearest BW measurement to target_day for each subject."""
-    bw_filtered = bw_df[bw_df["USUBJID"].isin(subjects)].copy()
-    if "BWDY" not in bw_filtered.columns:
+def _nearest_bw(bw_df: pd.DataFrame, target_day: int) -> dict[str, float]:
+    """Find nearest BW measurement to target_day for each subject in bw_df.
+
+    Callers pass bw_df already restricted to the subjects of interest.
+    Equidistant measurements resolve to the earlier day; duplicate days to
+    the first record.
+    """
+    if "BWDY" not in bw_df.columns:
+        return {}
+    bw = bw_df.dropna(subset=["BWDY", "value"]).sort_values(
+        ["USUBJID", "BWDY"], kind="stable",
+    )
+    if bw.empty:
         return {}
-    bw_filtered = bw_filtered.dropna(subset=["BWDY", "value"])
-    bw_filtered["day_diff"] = (bw_filtered["BWDY"] - target_day).abs()
-    # For each subject, pick the measurement closest to target_day
-    idx = bw_filtered.groupby("USUBJID")["day_diff"].idxmin()
-    nearest = bw_filtered.loc[idx]
-    return dict(zip(nearest["USUBJID"].values, nearest["value"].values.astype(float)))
+
+    # Sorted by (subject, day): one global searchsorted over a composite
+    # key (segment * span + day offset) replaces the per-subject groupby
+    seg, subj = pd.factorize(bw["USUBJID"], sort=True)
+    days = bw["BWDY"].to_numpy(dtype=float)
+    values = bw["value"].to_numpy(dtype=float)
+    d_min = days.min()
+    span = days.max() - d_min + 1
+    key = seg * span + (days - d_min)
+
+    starts = np.searchsorted(key, np.arange(len(subj)) * span - 0.5)
+    ends = np.r_[starts[1:], len(key)]
+    target = np.clip(target_day - d_min, -0.5, span - 0.5)
+    # hi: first day >= target; lo: first record on the last day < target
+    hi = np.searchsorted(key, np.arange(len(subj)) * span + target)
+    lo = np.maximum(hi - 1, starts)
+    lo = np.searchsorted(key, key[lo])
+    hi_dist = np.abs(days[np.minimum(hi, len(key) - 1)] - target_day)
+    lo_dist = np.abs(days[lo] - target_day)
+    use_hi = (hi < ends) & ((hi == starts) | (hi_dist < lo_dist))
+    pick = np.where(use_hi, hi, lo)
+    return dict(zip(subj, values[pick]))
 
 
 def _compute_overall_assessment(
@@ -561,15 +599,21 @@ def _get_epoch_boundaries(
             dm_df.columns = [c.upper() for c in dm_df.columns]
 
             if "ETCD" in se_df.columns and "SEENDTC" in se_df.columns:
+                se_df["ETCD"] = se_df["ETCD"].str.upper()
                 se_m = se_df.merge(dm_df[["USUBJID", "RFSTDTC"]], on="USUBJID", how="left")
-                se_m["SEENDTC_dt"] = pd.to_datetime(se_m["SEENDTC"], errors="coerce")
-                se_m["SESTDTC_dt"] = pd.to_datetime(se_m["SESTDTC"], errors="coerce")
-                se_m["RFSTDTC_dt"] = pd.to_datetime(se_m["RFSTDTC"], errors="coerce")
-                se_m["end_day"] = (se_m["SEENDTC_dt"] - se_m["RFSTDTC_dt"]).dt.days + 1
-                se_m["start_day"] = (se_m["SESTDTC_dt"] - se_m["RFSTDTC_dt"]).dt.days + 1
-
-                trt = se_m[se_m["ETCD"].str.upper().str.startswith("TRT")]
-                rec = se_m[se_m["ETCD"].str.upper() == "REC"]
+                # Parse all three --DTC columns in one to_datetime call (SEND
+                # dates are ISO 8601, so skip per-value format inference)
+                dtc_cols = ["SEENDTC", "SESTDTC", "RFSTDTC"]
+                dates = pd.to_datetime(
+                    pd.concat([se_m[c] for c in dtc_cols], keys=dtc_cols),
+                    errors="coerce", format="ISO8601",
+                )
+                rfstdtc_dt = dates.loc["RFSTDTC"]
+                se_m["end_day"] = (dates.loc["SEENDTC"] - rfstdtc_dt).dt.days + 1
+                se_m["start_day"] = (dates.loc["SESTDTC"] - rfstdtc_dt).dt.days + 1
+
+                trt = se_m[se_m["ETCD"].str.startswith("TRT")]
+                rec = se_m[se_m["ETCD"] == "REC"]
 
                 treatment_end = int(trt["end_day"].max()) if not trt.empty else None
                 recovery_start = int(rec["start_day"].min()) if not rec.empty else None
@@ -585,20 +629,24 @@ def _get_epoch_boundaries(
             te_df, _ = read_xpt(study.xpt_files["te"])
             te_df.columns = [c.upper() for c in te_df.columns]
             if "ETCD" in te_df.columns and "TEDUR" in te_df.columns:
-                treatment_days = None
-                for _, row in te_df.iterrows():
-                    etcd = str(row.get("ETCD", "")).upper().strip()
-                    dur = str(row.get("TEDUR", "")).strip()
-                    m = re.match(r"P(\d+)([DWMY])", dur)
-                    if not m:
-                        continue
-                    n, unit = int(m.group(1)), m.group(2)
-                    days = {"D": n, "W": n * 7, "M": n * 30, "Y": n * 365}.get(unit)
-                    if days and etcd.startswith("TRT"):
-                        if treatment_days is None or days > treatment_days:
-                            treatment_days = days
-                if treatment_days:
-                    result = {"treatment_end": treatment_days, "recovery_start": None}
+                # ISO 8601 durations (P13W etc.) -> days, longest TRT element wins
+                dur = (
+                    te_df["TEDUR"].astype(str).str.strip()
+                    .str.extract(r"^P(\d+)([DWMY])")
+                )
+                days = pd.to_numeric(dur[0], errors="coerce") * dur[1].map(
+                    {"D": 1, "W": 7, "M": 30, "Y": 365}
+                )
+                is_trt = (
+                    te_df["ETCD"].astype(str).str.upper().str.strip()
+                    .str.startswith("TRT")
+                )
+                trt_days = days[is_trt & (days > 0)]
+                if not trt_days.empty:
+                    result = {
+                        "treatment_end": int(trt_days.max()),
+                        "recovery_start": None,
+                    }
         except Exception:
             pass
 
@@ -612,17 +660,12 @@ def _get_epoch_boundaries(
     return result
 
 
-def _label_periods(
-    periods: list[dict],
-    study: StudyInfo,
-    last_dosing_day_override: int | None = None,
-) -> None:
+def _label_periods(periods: list[dict], bounds: dict) -> None:
     """Add epoch and label keys to each period dict in-place.
 
-    Uses SE domain for epoch boundaries (treatment_end, recovery_start),
-    falling back to TE durations.
+    bounds is the _get_epoch_boundaries() result (SE domain, falling back
+    to TE durations).
     """
-    bounds = _get_epoch_boundaries(study, last_dosing_day_override=last_dosing_day_override)
     treatment_end = bounds["treatment_end"]
     recovery_start = bounds.get("recovery_start")
 
@@ -647,23 +690,33 @@ def _compute_recovery(
     fw_findings: list[dict],
     bw_findings: list[dict],
     study: StudyInfo,
+    fw_df: pd.DataFrame | None = None,
+    bw_df: pd.DataFrame | None = None,
+    subjects: pd.DataFrame | None = None,
 ) -> dict | None:
-    """Analyze FW and BW during recovery period (if recovery subjects exist)."""
+    """Analyze FW and BW during recovery period (if recovery subjects exist).
+
+    fw_df/bw_df are the unmerged _read_fw_raw/_read_bw_raw frames and
+    subjects the build_dose_groups() subjects frame when the caller already
+    has them; otherwise they are read/built here.
+    """
     from services.analysis.dose_groups import build_dose_groups
 
-    try:
-        dg_data = build_dose_groups(study)
-        subjects = dg_data["subjects"]
-    except Exception:
-        return None
+    if subjects is None:
+        try:
+            subjects = build_dose_groups(study)["subjects"]
+        except Exception:
+            return None
 
     recovery_subs = subjects[subjects["is_recovery"]].copy()
     if recovery_subs.empty:
         return None
 
     # Read raw data for recovery subjects
-    fw_df = _read_fw_raw(study)
-    bw_df = _read_bw_raw(study)
+    if fw_df is None:
+        fw_df = _read_fw_raw(study)
+    if bw_df is None:
+        bw_df = _read_bw_raw(study)
     if fw_df is None or bw_df is None:
         return None
 
@@ -744,20 +797,34 @@ def build_food_consumption_summary_with_subjects(
     """
     from services.analysis.dose_groups import build_dose_groups
 
-    # Get subjects for dose_level merge
-    dg_data = build_dose_groups(study)
-    subjects = dg_data["subjects"]
-    main_subs = subjects[~subjects["is_recovery"] & ~subjects["is_satellite"]].copy()
-
     fw_findings = [f for f in findings if f.get("domain") == "FW"]
     bw_findings = [f for f in findings if f.get("domain") == "BW"]
 
-    if not fw_findings:
+    # Nothing to cross-reference without both domains -- skip every XPT read
+    if not fw_findings or not _has_fw_and_bw(study):
         return {"available": False}
 
-    # Read raw data
-    fw_df = _read_fw_raw(study)
-    bw_df = _read_bw_raw(study)
+    # Raw FW/BW/TS/SE reads are independent I/O + parse jobs (pyreadstat
+    # releases the GIL) -- overlap them with the dose-group build
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        fut_fw = pool.submit(_read_fw_raw, study)
+        fut_bw = pool.submit(_read_bw_raw, study)
+        fut_route = pool.submit(_get_study_route, study)
+        fut_bounds = pool.submit(
+            _get_epoch_boundaries, study,
+            last_dosing_day_override=last_dosing_day_override,
+        )
+
+        # Get subjects for dose_level merge
+        dg_data = build_dose_groups(study)
+        subjects = dg_data["subjects"]
+        main_subs = subjects[
+            ~subjects["is_recovery"] & ~subjects["is_satellite"]
+        ].copy()
+
+    fw_raw = fut_fw.result()
+    bw_raw = fut_bw.result()
+    fw_df, bw_df = fw_raw, bw_raw
 
     if fw_df is None or bw_df is None or fw_df.empty or bw_df.empty:
         return {"available": False}
@@ -767,16 +834,16 @@ def build_food_consumption_summary_with_subjects(
     bw_df = bw_df.merge(main_subs[["USUBJID", "SEX", "dose_level"]], on="USUBJID", how="inner")
 
     # Get study route
-    study_route = _get_study_route(study)
+    study_route = fut_route.result()
     caloric_dilution_risk = _assess_caloric_dilution(study_route)
 
     # Check for water
     # numpy.bool_ fails identity checks; convert at boundary
-    has_water = bool("FWTESTCD" in fw_df.columns and (fw_df["FWTESTCD"].str.upper() == "WC").any())
+    has_water = bool("FWTESTCD" in fw_df.columns and (fw_df["FWTESTCD"] == "WC").any())
 
     # Filter to FC only
     if "FWTESTCD" in fw_df.columns:
-        fw_food = fw_df[fw_df["FWTESTCD"].str.upper() == "FC"].copy()
+        fw_food = fw_df[fw_df["FWTESTCD"] == "FC"].copy()
         if fw_food.empty:
             fw_food = fw_df.copy()
     else:
@@ -788,29 +855,48 @@ def build_food_consumption_summary_with_subjects(
     # periods (e.g. interim (1,29)) are preserved.  BW is untouched — point
     # measurements are fine for matching any period.
     if early_death_subjects and "FWDY" in fw_food.columns and "FWENDY" in fw_food.columns:
-        excluded = set(early_death_subjects.keys())
-        pair_counts = fw_food.groupby(["FWDY", "FWENDY"])["USUBJID"].nunique()
-        total_subjects = fw_food["USUBJID"].nunique()
+        # One pass over integer codes: factorize each day column (NaN -> -1)
+        # and USUBJID (never null after the DM merge), fold (pair, subject)
+        # into one int64 key, and count distinct subjects per pair with
+        # np.unique + bincount; the verdict maps back per row by indexing.
+        dy_codes, dy_uniques = pd.factorize(fw_food["FWDY"])
+        endy_codes, endy_uniques = pd.factorize(fw_food["FWENDY"])
+        subj_codes, subj_uniques = pd.factorize(fw_food["USUBJID"])
+        n_pairs = len(dy_uniques) * len(endy_uniques)
+        total_subjects = len(subj_uniques)
+        has_pair = (dy_codes >= 0) & (endy_codes >= 0)
+        pair_codes = np.where(
+            has_pair, dy_codes * len(endy_uniques) + endy_codes, 0,
+        ).astype(np.int64)
+        pair_subj = np.unique(
+            pair_codes[has_pair] * total_subjects + subj_codes[has_pair]
+        )
+        pair_counts = np.bincount(
+            pair_subj // max(total_subjects, 1), minlength=n_pairs,
+        )
         threshold = max(3, total_subjects * 0.05)
-        anomalous_pairs = {
-            idx for idx, n in pair_counts.items() if n < threshold
-        }
-        if anomalous_pairs:
-            is_early = fw_food["USUBJID"].isin(excluded)
-            is_anomalous = fw_food[["FWDY", "FWENDY"]].apply(tuple, axis=1).isin(anomalous_pairs)
-            fw_food = fw_food[~(is_early & is_anomalous)].copy()
+        is_anomalous_pair = (pair_counts > 0) & (pair_counts < threshold)
+        if is_anomalous_pair.any():
+            # Membership is tested once per distinct subject and broadcast
+            # through the codes; the masks are combined in place.
+            drop = subj_uniques.isin(early_death_subjects.keys())[subj_codes]
+            drop &= has_pair
+            drop &= is_anomalous_pair[pair_codes]
+            fw_food = fw_food[~drop]
 
     # Compute periods with merged data
     periods = _compute_periods(fw_food, bw_df)
 
     # Label periods with epoch names from TE domain
-    _label_periods(periods, study, last_dosing_day_override=last_dosing_day_override)
+    _label_periods(periods, fut_bounds.result())
 
     # Overall assessment
     overall = _compute_overall_assessment(fw_findings, bw_findings, periods)
 
-    # Recovery
-    recovery = _compute_recovery(fw_findings, bw_findings, study)
+    # Recovery (reuses the unmerged raw reads -- recovery animals are not in main_subs)
+    recovery = _compute_recovery(
+        fw_findings, bw_findings, study, fw_df=fw_raw, bw_df=bw_raw, subjects=subjects,
+    )
 
     return {
         "available": True,
@@ -2,14 +2,20 @@
 
 Usage:
     cd backend && python -m generator.generate PointCross
+    cd backend && python -m generator.generate PointCross Nimble  # one worker process per study
 """
 
 import json
+import os
+import re
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -45,15 +51,130 @@ from services.analysis.send_knowledge import (
 OUTPUT_DIR = Path(__file__).parent.parent / "generated"
 
 
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _orjson_default(obj):
+    """Fallback for types orjson does not serialize natively (mirrors sanitize)."""
+    if isinstance(obj, np.ndarray):
+        # object-dtype or non-contiguous arrays
+        return obj.tolist()
+    if isinstance(obj, set):
+        return sorted(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps_json(data) -> bytes:
+    """Serialize to compact JSON bytes, semantically equivalent to the old
+    json.dump path (float repr may differ).
+
+    orjson handles numpy scalars/arrays and writes NaN/Inf as null, so the
+    recursive sanitize() pass is only needed for the (rare) >64-bit int
+    fallback. Output stays ASCII-only (\\uXXXX escapes, as json.dump's
+    ensure_ascii) since some readers open these files with the platform
+    default encoding.
+    """
+    try:
+        out = orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTS)
+    except orjson.JSONEncodeError:
+        from services.analysis.sanitize import sanitize
+        return json.dumps(sanitize(data), separators=(",", ":")).encode("ascii")
+    if out.isascii():
+        return out
+    text = _NON_ASCII.sub(lambda m: json.dumps(m.group())[1:-1], out.decode("utf-8"))
+    return text.encode("ascii")
+
+
+def _json_chunks(data):
+    """Yield the JSON encoding of *data* in pieces.
+
+    Top-level lists (the large row-oriented outputs) are encoded one element
+    at a time, so the full document never exists as a single bytes object.
+    """
+    if not isinstance(data, list):
+        yield _dumps_json(data)
+        return
+    yield b"["
+    for i, item in enumerate(data):
+        if i:
+            yield b","
+        yield _dumps_json(item)
+    yield b"]"
+
+
+def _write_json_file(path: Path, data, mkdir: bool = True):
+    """Stream JSON to *path* through a 1 MiB write buffer."""
+    if mkdir:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb", buffering=1 << 20) as f:
+        for chunk in _json_chunks(data):
+            f.write(chunk)
+
+
 def _write_json(path: Path, data):
     """Write sanitized JSON."""
-    from services.analysis.sanitize import sanitize
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(sanitize(data), f, separators=(",", ":"))
+    _write_json_file(path, data)
     print(f"  wrote {path.name} ({_count(data)} items)")
 
 
+_ARROW_SCALARS = frozenset({str, int, float, bool})
+
+
+def _arrow_lossless(values) -> bool:
+    """True if Arrow round-trips an object column of *values* unchanged.
+
+    Arrow infers one type per column, so dicts become structs (missing keys
+    filled with None) and mixed int/float widens to float. Only a single
+    scalar type, optionally with None, survives as-is.
+    """
+    kinds = {type(v) for v in values}
+    kinds.discard(type(None))
+    return len(kinds) <= 1 and kinds <= _ARROW_SCALARS
+
+
+def _frame_records(df) -> list[dict]:
+    """Rows of *df* as dicts, converted column-wise through Arrow.
+
+    Same values and types as ``df.to_dict(orient="records")`` (NaN stays
+    NaN, missing object values stay None) without boxing per cell in pandas.
+    Frames Arrow cannot convert losslessly (datetimes, NaN-holding string
+    columns, object columns of containers or mixed scalar types) fall back
+    to pandas.
+    """
+    import pyarrow as pa
+    if df.columns.is_unique and all(dt.kind in "fiubO" for dt in df.dtypes):
+        arrays = {col: df[col].to_numpy() for col in df.columns}
+        if all(
+            arr.dtype.kind != "O" or _arrow_lossless(arr) for arr in arrays.values()
+        ):
+            try:
+                return pa.table({
+                    col: pa.array(arr, from_pandas=False) for col, arr in arrays.items()
+                }).to_pylist()
+            except (pa.ArrowException, TypeError, ValueError):
+                pass
+    return df.to_dict(orient="records")
+
+
+def _write_json_many(items: list[tuple[Path, object]]):
+    """Write independent JSON outputs concurrently; log in submission order.
+
+    orjson releases the GIL while encoding, so the dumps and the disk writes
+    of different files overlap across threads.
+    """
+    # One mkdir per distinct directory rather than one per file.
+    for parent in {path.parent for path, _ in items}:
+        parent.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=min(len(items), os.cpu_count() or 1) or 1) as pool:
+        futures = [pool.submit(_write_json_file, path, data, False) for path, data in items]
+    for (path, data), fut in zip(items, futures):
+        fut.result()
+        print(f"  wrote {path.name} ({_count(data)} items)")
+
+
 def _count(data) -> str:
     if isinstance(data, list):
         return str(len(data))
@@ -162,7 +283,12 @@ def generate(study_id: str):
         animal_exclusions=animal_exclusions if animal_exclusions else None,
     )
     dose_groups = dg_data["dose_groups"]
-    print(f"  {len(findings)} findings across {len(set(f['domain'] for f in findings))} domains")
+    # domains_seen is collected by the stats pass; adapters that build
+    # findings differently fall back to a scan.
+    domains_seen = dg_data.get("domains_seen")
+    if domains_seen is None:
+        domains_seen = {f["domain"] for f in findings}
+    print(f"  {len(findings)} findings across {len(domains_seen)} domains")
 
     # Phase C: VC-UC supplementary comparison for dual-control studies
     ctrl_cmp = None
@@ -255,6 +381,7 @@ def generate(study_id: str):
     # Phase 1c results (may have failed in thread)
     provenance_msgs = []
     ctx_df = None
+    ctx_records = None
     try:
         context_result = fut_ctx.result()
 
@@ -291,7 +418,10 @@ def generate(study_id: str):
             })
 
         ctx_df = context_result["subject_context"]
-        _write_json(out_dir / "subject_context.json", ctx_df.to_dict(orient="records"))
+        # Materialized once: the NOAEL overlay, similarity, and rollup
+        # phases consume the same records read-only.
+        ctx_records = _frame_records(ctx_df)
+        _write_json(out_dir / "subject_context.json", ctx_records)
         auto_detected = compute_last_dosing_day(study)
         effective = last_dosing_day_override if last_dosing_day_override is not None else auto_detected
         context_result["study_metadata"]["last_dosing_day"] = effective
@@ -605,64 +735,70 @@ def generate(study_id: str):
     signal_summary = views["study_signal_summary"]
     rule_results = views["rule_results"]
 
-    # Per-subject NOAEL overlay + signal summary
-    # Use `findings` (original from adapter) which still has raw_subject_values.
-    # views["unified_findings"]["findings"] is already stripped by the pipeline.
-    if ctx_df is not None:
-        noael_overlay = build_subject_noael_overlay(
-            noael, ctx_df.to_dict(orient="records"), findings=findings,
-        )
-        _write_json(out_dir / "subject_noael_overlay.json", noael_overlay)
-        n_determining = sum(
-            1 for s in noael_overlay["subjects"].values()
-            if s["noael_role"] == "determining"
+    # Phases 2b/4 need only noael / target_organs — start them now so they
+    # overlap the per-subject overlay, correlation, and similarity steps.
+    # The pool spans every step up to result collection so a failure
+    # anywhere in between still shuts it down.
+    _tick("2b34_start")
+    with ThreadPoolExecutor(max_workers=2) as pool_2b4:
+        fut_pk = pool_2b4.submit(
+            build_pk_integration, study, dose_groups, noael, dg_data.get("tk_setcds"),
         )
-        n_bw = sum(1 for s in noael_overlay["subjects"].values() if s.get("bw_terminal_pct") is not None)
-        n_lb = sum(1 for s in noael_overlay["subjects"].values() if s.get("lb_max_fold") is not None)
-        print(f"  NOAEL overlay: {n_determining} determining, {n_bw} BW, {n_lb} LB signals")
-
-        # Subject correlations (needs raw_subject_values)
-        print("  Computing subject correlations...")
-        try:
-            correlations = build_subject_correlations(findings)
-            _write_json(out_dir / "subject_correlations.json", correlations)
-            n_corr = correlations["meta"]["n_significant_pairs"]
-            n_ep = correlations["meta"]["n_endpoints_analyzed"]
-            print(f"  Correlations: {n_corr} significant pairs from {n_ep} endpoints")
-        except Exception as e:
-            print(f"  WARNING: Subject correlations failed: {e}")
-
-        # Phase 2x: Subject similarity (needs noael_overlay + raw_subject_values)
-        print("Phase 2x: Computing subject similarity...")
-        try:
-            similarity = build_subject_similarity(
-                findings, study, ctx_df.to_dict(orient="records"),
-                noael_overlay=noael_overlay,
-                early_death_subjects=early_death_subjects,
+        fut_chart = pool_2b4.submit(generate_target_organ_bar_chart, target_organs)
+
+        # Per-subject NOAEL overlay + signal summary
+        # Use `findings` (original from adapter) which still has raw_subject_values.
+        # views["unified_findings"]["findings"] is already stripped by the pipeline.
+        if ctx_df is not None:
+            noael_overlay = build_subject_noael_overlay(
+                noael, ctx_records, findings=findings,
             )
-            _write_json(out_dir / "subject_similarity.json", similarity)
-            meta = similarity.get("meta", {})
-            n_elig = meta.get("n_subjects_eligible", 0)
-            n_excl = meta.get("n_excluded", 0)
-            n_feats = meta.get("n_features", 0)
-            stress = meta.get("mds_stress")
-            supp = meta.get("similarity_suppressed", False)
-            if supp:
-                print(f"  Similarity: {n_elig} eligible, {n_excl} TK excluded, {n_feats} features (suppressed, N<{15})")
-            else:
-                print(f"  Similarity: {n_elig} eligible, {n_excl} TK excluded, {n_feats} features, stress={stress}")
-        except Exception as e:
-            print(f"  WARNING: Subject similarity failed: {e}")
-
-    _tick("2_end")
-
-    # Phases 2b/4 — independent computations, run in parallel
-    _tick("2b34_start")
-    print("Phases 2b/4: PK, charts (parallel)...")
-    with ThreadPoolExecutor(max_workers=2) as pool:
-        fut_pk = pool.submit(build_pk_integration, study, dose_groups, noael, dg_data.get("tk_setcds"))
-        fut_chart = pool.submit(generate_target_organ_bar_chart, target_organs)
+            _write_json(out_dir / "subject_noael_overlay.json", noael_overlay)
+            n_determining = sum(
+                1 for s in noael_overlay["subjects"].values()
+                if s["noael_role"] == "determining"
+            )
+            n_bw = sum(1 for s in noael_overlay["subjects"].values() if s.get("bw_terminal_pct") is not None)
+            n_lb = sum(1 for s in noael_overlay["subjects"].values() if s.get("lb_max_fold") is not None)
+            print(f"  NOAEL overlay: {n_determining} determining, {n_bw} BW, {n_lb} LB signals")
 
+            # Subject correlations (needs raw_subject_values)
+            print("  Computing subject correlations...")
+            try:
+                correlations = build_subject_correlations(findings)
+                _write_json(out_dir / "subject_correlations.json", correlations)
+                n_corr = correlations["meta"]["n_significant_pairs"]
+                n_ep = correlations["meta"]["n_endpoints_analyzed"]
+                print(f"  Correlations: {n_corr} significant pairs from {n_ep} endpoints")
+            except Exception as e:
+                print(f"  WARNING: Subject correlations failed: {e}")
+
+            # Phase 2x: Subject similarity (needs noael_overlay + raw_subject_values)
+            print("Phase 2x: Computing subject similarity...")
+            try:
+                similarity = build_subject_similarity(
+                    findings, study, ctx_records,
+                    noael_overlay=noael_overlay,
+                    early_death_subjects=early_death_subjects,
+                )
+                _write_json(out_dir / "subject_similarity.json", similarity)
+                meta = similarity.get("meta", {})
+                n_elig = meta.get("n_subjects_eligible", 0)
+                n_excl = meta.get("n_excluded", 0)
+                n_feats = meta.get("n_features", 0)
+                stress = meta.get("mds_stress")
+                supp = meta.get("similarity_suppressed", False)
+                if supp:
+                    print(f"  Similarity: {n_elig} eligible, {n_excl} TK excluded, {n_feats} features (suppressed, N<{15})")
+                else:
+                    print(f"  Similarity: {n_elig} eligible, {n_excl} TK excluded, {n_feats} features, stress={stress}")
+            except Exception as e:
+                print(f"  WARNING: Subject similarity failed: {e}")
+
+        _tick("2_end")
+
+        # Phases 2b/4 — independent computations, running since Phase 2
+        print("Phases 2b/4: PK, charts (parallel)...")
         # Write view outputs while parallel computations run
         # Pipeline already built unified_findings with IDs, correlations,
         # summary, and pagination — single code path for all settings.
@@ -683,27 +819,28 @@ def generate(study_id: str):
             ]
 
         print("Writing Phase 2 output files...")
-        for view_name, data in views.items():
-            _write_json(out_dir / f"{view_name}.json", data)
-
-    # Collect parallel results and write
-    pk_integration = fut_pk.result()
-    _write_json(out_dir / "pk_integration.json", pk_integration)
-    if pk_integration.get("available"):
-        n_tk = pk_integration["tk_design"]["n_tk_subjects"]
-        hed = pk_integration["hed"]["hed_mg_kg"] if pk_integration.get("hed") else None
-        hed_str = f", HED={hed:.2f} mg/kg" if hed is not None else ""
-        print(f"  2b: {n_tk} TK subjects{hed_str}")
-    else:
-        print("  2b: No PC/PP data available")
+        _write_json_many([
+            (out_dir / f"{view_name}.json", data) for view_name, data in views.items()
+        ])
+
+        # Collect parallel results and write
+        pk_integration = fut_pk.result()
+        _write_json(out_dir / "pk_integration.json", pk_integration)
+        if pk_integration.get("available"):
+            n_tk = pk_integration["tk_design"]["n_tk_subjects"]
+            hed = pk_integration["hed"]["hed_mg_kg"] if pk_integration.get("hed") else None
+            hed_str = f", HED={hed:.2f} mg/kg" if hed is not None else ""
+            print(f"  2b: {n_tk} TK subjects{hed_str}")
+        else:
+            print("  2b: No PC/PP data available")
 
-    print(f"  3: {len(rule_results)} rules emitted")
+        print(f"  3: {len(rule_results)} rules emitted")
 
-    target_organ_html = fut_chart.result()
-    static_dir.mkdir(parents=True, exist_ok=True)
-    with open(static_dir / "target_organ_bar.html", "w") as f:
-        f.write(target_organ_html)
-    print("  4: wrote static/target_organ_bar.html")
+        target_organ_html = fut_chart.result()
+        static_dir.mkdir(parents=True, exist_ok=True)
+        with open(static_dir / "target_organ_bar.html", "w") as f:
+            f.write(target_organ_html)
+        print("  4: wrote static/target_organ_bar.html")
 
     # Phase 2c: Per-study syndrome rollup (consumes subject_syndromes + noael + recovery + mortality).
     # Pure aggregation -- no XPT re-read; safe to run sequentially after Phase 2.
@@ -713,7 +850,7 @@ def generate(study_id: str):
             rv_data = recovery_verdicts if 'recovery_verdicts' in locals() else None
             syndrome_rollup = build_syndrome_rollup(
                 subject_syndromes=ss_data,
-                subject_context=ctx_df.to_dict(orient="records"),
+                subject_context=ctx_records,
                 noael_summary=noael,
                 mortality=mortality,
                 recovery_verdicts=rv_data,
@@ -796,10 +933,48 @@ def generate(study_id: str):
         print(f"    {label:<42s} {dt:6.2f}s")
 
 
+def _preimport():
+    """Worker initializer: pay the heavy imports once per process."""
+    import pandas  # noqa: F401
+    import pyarrow  # noqa: F401
+    import scipy.stats  # noqa: F401
+
+
+def generate_many(study_ids: list[str], max_workers: int | None = None) -> list[str]:
+    """Generate several studies on a pool of warm worker processes.
+
+    Studies share no state, so each runs in its own process (the per-study
+    phases already use threads internally). A single study runs inline.
+    Returns the study IDs that failed.
+    """
+    if len(study_ids) == 1:
+        generate(study_ids[0])
+        return []
+
+    workers = max_workers or min(len(study_ids), os.cpu_count() or 1)
+    failed: list[str] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_preimport) as pool:
+        futures = {pool.submit(generate, sid): sid for sid in study_ids}
+        try:
+            for fut in as_completed(futures):
+                sid = futures[fut]
+                try:
+                    fut.result()
+                except (Exception, SystemExit) as e:  # SystemExit: generate() exits on bad input
+                    print(f"ERROR: Generation failed for '{sid}': {e!r}")
+                    failed.append(sid)
+        except KeyboardInterrupt:
+            # Drop the queued studies instead of letting shutdown(wait=True) run them.
+            pool.shutdown(cancel_futures=True)
+            raise
+    return failed
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python -m generator.generate <study_id>")
+        print("Usage: python -m generator.generate <study_id> [<study_id> ...]")
         print("Example: python -m generator.generate PointCross")
         sys.exit(1)
 
-    generate(sys.argv[1])
+    if generate_many(sys.argv[1:]):
+        sys.exit(1)
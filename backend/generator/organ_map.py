@@ -3,9 +3,44 @@
 Reuses send_knowledge.py mappings and adds generator-specific helpers.
 """
 
+from functools import lru_cache
+
 from services.analysis.send_knowledge import BIOMARKER_MAP, ORGAN_SYSTEM_MAP
 
+# Domain-level defaults
+_DOMAIN_DEFAULTS = {
+    "BW": "general",
+    "FW": "general",
+    "LB": "general",
+    "MI": "general",
+    "MA": "general",
+    "OM": "general",
+    "CL": "general",
+    "DS": "general",
+    "TF": "general",
+    "PM": "general",
+    "EG": "cardiovascular",
+    "VS": "cardiovascular",
+    "BG": "general",
+}
+
+# Prefix keys bucketed by first character. Each bucket keeps map order so the
+# first matching key still wins -- some keys are prefixes of later keys, so
+# this is deliberately not a longest-prefix match.
+_PREFIX_BUCKETS: dict[str, list[tuple[str, str]]] = {}
+for _key, _system in ORGAN_SYSTEM_MAP.items():
+    _PREFIX_BUCKETS.setdefault(_key[:1], []).append((_key, _system))
+
+
+def _prefix_system(upper: str) -> str | None:
+    """First ORGAN_SYSTEM_MAP key (in map order) that prefixes *upper*."""
+    for key, candidate in _PREFIX_BUCKETS.get(upper[:1], ()):
+        if upper.startswith(key):
+            return candidate
+    return None
+
 
+@lru_cache(maxsize=4096)
 def get_organ_system(specimen: str | None, test_code: str | None = None,
                      domain: str | None = None) -> str:
     """Resolve organ system from specimen name, test code, or domain.
@@ -17,35 +52,20 @@ def get_organ_system(specimen: str | None, test_code: str | None = None,
         if upper in ORGAN_SYSTEM_MAP:
             return ORGAN_SYSTEM_MAP[upper]
         # Partial match for compound names like "LYMPH NODE, INGUINAL"
-        for key, system in ORGAN_SYSTEM_MAP.items():
-            if upper.startswith(key):
-                return system
+        system = _prefix_system(upper)
+        if system is not None:
+            return system
 
     if test_code and test_code in BIOMARKER_MAP:
         return BIOMARKER_MAP[test_code].get("system", "general")
 
-    # Domain-level defaults
-    domain_defaults = {
-        "BW": "general",
-        "FW": "general",
-        "LB": "general",
-        "MI": "general",
-        "MA": "general",
-        "OM": "general",
-        "CL": "general",
-        "DS": "general",
-        "TF": "general",
-        "PM": "general",
-        "EG": "cardiovascular",
-        "VS": "cardiovascular",
-        "BG": "general",
-    }
     if domain:
-        return domain_defaults.get(domain, "general")
+        return _DOMAIN_DEFAULTS.get(domain, "general")
 
     return "general"
 
 
+@lru_cache(maxsize=4096)
 def get_organ_name(specimen: str | None, test_code: str | None = None) -> str:
     """Get a human-readable organ name."""
     if specimen:
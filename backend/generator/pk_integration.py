@@ -10,6 +10,7 @@ Pattern follows tumor_summary.py (cross-domain generator module).
 import json
 import logging
 import math
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -18,7 +19,7 @@ from scipy import stats as scipy_stats
 
 from generator.subject_syndromes import SEVERITY_MAP
 from services.study_discovery import StudyInfo
-from services.xpt_processor import read_xpt
+from services.xpt_processor import read_xpt, read_xpt_columns
 
 log = logging.getLogger(__name__)
 
@@ -156,6 +157,8 @@ def build_pk_integration(
         return {"available": False}
     if "dm" not in study.xpt_files:
         return {"available": False}
+    if not _pp_dm_linkable(study):
+        return {"available": False}
 
     try:
         pc_df = _read_domain(study, "pc")
@@ -175,10 +178,15 @@ def build_pk_integration(
     # Detect TK satellite design — use authoritative tk_setcds from dose_groups
     tk_design = _detect_tk_design(dm_df, tk_setcds=tk_setcds)
 
+    # SETCD -> dose_level, shared by the PP and PC linking steps
+    setcd_map = (
+        _build_setcd_dose_map(dm_df, dose_groups, tk_setcds=tk_setcds)
+        if "SETCD" in dm_df.columns else {}
+    )
+
     # Link TK subjects to dose levels
     pp_merged = _link_tk_to_dose(
-        pp_df, dm_df, dose_groups, tk_setcds=tk_setcds,
-        pooldef_df=pooldef_df,
+        pp_df, dm_df, dose_groups, setcd_map, pooldef_df=pooldef_df,
     )
     if pp_merged.empty:
         return {"available": False}
@@ -197,8 +205,7 @@ def build_pk_integration(
 
     # Build per-dose-group stats
     by_dose_group = _build_dose_group_stats(
-        pp_merged, pc_df, dm_df, dose_groups, tk_design, lloq,
-        tk_setcds=tk_setcds,
+        pp_merged, pc_df, dm_df, dose_groups, tk_design, lloq, setcd_map,
     )
 
     # Dose proportionality (needs ≥ 3 dose groups with AUC)
@@ -218,8 +225,9 @@ def build_pk_integration(
     noael_dose_level, loael_dose_level, noael_dose_value = _get_noael_loael_levels(noael)
 
     # Extract exposure at NOAEL and LOAEL
-    noael_exposure = _extract_exposure_at_dose(by_dose_group, noael_dose_level)
-    loael_exposure = _extract_exposure_at_dose(by_dose_group, loael_dose_level)
+    dose_index = {g["dose_level"]: g for g in by_dose_group}
+    noael_exposure = _extract_exposure_at_dose(dose_index, noael_dose_level)
+    loael_exposure = _extract_exposure_at_dose(dose_index, loael_dose_level)
 
     # HED/MRSD computation
     hed = _compute_hed(noael_dose_value, km_info, noael_dose_level)
@@ -1111,10 +1119,10 @@ def _classify_severe_toxicity_tier2(
     # Count severe subjects among treated only (exclude controls + TK)
     treated_uids = {uid for uid, info in subj_info.items()
                     if not info["is_control"] and not info["is_tk"]}
-    total_severe_treated = sum(1 for uid in all_severe if uid in treated_uids)
+    total_severe_treated = len(all_severe.keys() & treated_uids)
 
     # Acute BW events: flagged for review, not counted in severity numerator
-    acute_count = sum(1 for uid in bw_acute_events if uid in treated_uids)
+    acute_count = len(bw_acute_events.keys() & treated_uids)
 
     return {
         "severity_data": severity_data,
@@ -1659,18 +1667,69 @@ def _compute_safety_margin_v2(
 # ─── Domain reading ───────────────────────────────────────────
 
 
+# Variables this module reads per domain; only these are decoded from the XPT.
+# PC/PP also keep the DM columns (SEX/SETCD/ARMCD) they are merged with, so a
+# study that carries them on both sides resolves the merge exactly as before.
+_DOMAIN_COLUMNS: dict[str, tuple[str, ...]] = {
+    "pc": ("USUBJID", "PCTESTCD", "PCSPEC", "PCSTRESN", "PCSTRESU", "PCLLOQ",
+           "PCORNRLO", "PCELTM", "PCTPTNUM", "PCTPT", "SEX", "SETCD", "ARMCD"),
+    "pp": ("USUBJID", "POOLID", "PPTESTCD", "PPSTRESN", "PPSTRESU", "VISITDY",
+           "PPDY", "SEX", "SETCD", "ARMCD"),
+    "dm": ("USUBJID", "SEX", "SETCD", "ARMCD"),
+    "pooldef": ("POOLID", "USUBJID"),
+    "ds": ("USUBJID", "DSDECOD"),
+    "ts": ("TSPARMCD", "TSVAL"),
+    "ex": ("USUBJID", "EXFREQ"),
+    "bw": ("USUBJID", "BWSTRESN", "BWDY", "VISITDY"),
+    "cl": ("USUBJID", "CLSTRESC"),
+    "ma": ("USUBJID", "MASEV", "MASTRESC"),
+    "mi": ("USUBJID", "MISTRESC", "MISEV", "MISPEC", "MILOC"),
+}
+
+
+@lru_cache(maxsize=32)
+def _read_domain_cached(
+    path: str, mtime_ns: int, columns: tuple[str, ...] | None = None,
+) -> pd.DataFrame:
+    """Parse an XPT with uppercased columns. Cached by (path, mtime, columns)
+    so a rewritten file is re-read; callers get shallow copies, which is
+    only safe under pandas Copy-on-Write (pandas>=3, see requirements.txt)."""
+    df, _ = read_xpt(Path(path), columns=list(columns) if columns is not None else None)
+    df.columns = [c.upper() for c in df.columns]
+    return df
+
+
 def _read_domain(study: StudyInfo, domain: str) -> pd.DataFrame | None:
     """Read a domain XPT and normalize column names to uppercase."""
     if domain not in study.xpt_files:
         return None
     try:
-        df, _ = read_xpt(study.xpt_files[domain])
-        df.columns = [c.upper() for c in df.columns]
-        return df
+        path = study.xpt_files[domain]
+        df = _read_domain_cached(
+            str(path), path.stat().st_mtime_ns, _DOMAIN_COLUMNS.get(domain),
+        )
+        return df.copy(deep=False)
     except Exception:
         return None
 
 
+def _pp_dm_linkable(study: StudyInfo) -> bool:
+    """Header-only check that PP can be linked to DM dose groups.
+
+    _link_tk_to_dose needs USUBJID in both domains and a SETCD or ARMCD
+    column on either side; without them the result is unavailable anyway,
+    so skip parsing PC/PP/DM. Unreadable headers defer to the full read.
+    """
+    try:
+        pp_cols = {c.upper() for c in read_xpt_columns(study.xpt_files["pp"])}
+        dm_cols = {c.upper() for c in read_xpt_columns(study.xpt_files["dm"])}
+    except Exception:
+        return True
+    if "USUBJID" not in pp_cols or "USUBJID" not in dm_cols:
+        return False
+    return bool({"SETCD", "ARMCD"} & (pp_cols | dm_cols))
+
+
 # ─── TK satellite design detection ────────────────────────────
 
 
@@ -1690,20 +1749,26 @@ def _detect_tk_design(dm_df: pd.DataFrame, tk_setcds: set[str] | None = None) ->
             "individual_correlation_possible": True,
         }
 
-    set_codes = dm_df["SETCD"].dropna().unique()
+    # One hash pass over DM: rows per distinct non-null SETCD. Classification
+    # and the TK subject count then work on the few distinct codes.
+    setcd_counts = dm_df["SETCD"].value_counts(sort=False)
+    set_codes = setcd_counts.index
+    stripped = {sc: str(sc).strip() for sc in set_codes}
 
     if tk_setcds is not None:
         # Use authoritative classification from dose_groups
-        tk_codes = sorted(s for s in (str(sc).strip() for sc in set_codes) if s in tk_setcds)
-        main_codes = sorted(s for s in (str(sc).strip() for sc in set_codes) if s not in tk_setcds)
+        tk_codes = sorted(s for s in stripped.values() if s in tk_setcds)
+        main_codes = sorted(s for s in stripped.values() if s not in tk_setcds)
     else:
         # Fallback: simple suffix match (legacy behavior)
-        tk_codes = sorted(str(s) for s in set_codes if str(s).upper().endswith("TK"))
-        main_codes = sorted(str(s) for s in set_codes if not str(s).upper().endswith("TK"))
+        flagged = [(str(s), str(s).upper().endswith("TK")) for s in set_codes]
+        tk_codes = sorted(s for s, tk in flagged if tk)
+        main_codes = sorted(s for s, tk in flagged if not tk)
 
     n_tk = 0
     if tk_codes:
-        n_tk = int(dm_df[dm_df["SETCD"].astype(str).str.strip().isin(tk_codes)].shape[0])
+        tk_code_set = set(tk_codes)
+        n_tk = int(sum(n for sc, n in setcd_counts.items() if stripped[sc] in tk_code_set))
 
     return {
         "has_satellite_groups": len(tk_codes) > 0,
@@ -1721,7 +1786,7 @@ def _link_tk_to_dose(
     pp_df: pd.DataFrame,
     dm_df: pd.DataFrame,
     dose_groups: list[dict],
-    tk_setcds: set[str] | None = None,
+    setcd_map: dict,
     pooldef_df: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """Merge PP with DM to get dose_level and sex per TK subject.
@@ -1744,8 +1809,7 @@ def _link_tk_to_dose(
 
     if is_pooled:
         return _link_pooled_tk_to_dose(
-            pp_df, dm_df, dose_groups, tk_setcds=tk_setcds,
-            pooldef_df=pooldef_df,
+            pp_df, dm_df, dose_groups, setcd_map, pooldef_df=pooldef_df,
         )
 
     # --- Individual PK path (original logic) ---
@@ -1755,17 +1819,17 @@ def _link_tk_to_dose(
     if "ARMCD" in dm_df.columns:
         dm_cols.append("ARMCD")
 
-    dm_sub = dm_df[[c for c in dm_cols if c in dm_df.columns]].copy()
+    dm_sub = dm_df[[c for c in dm_cols if c in dm_df.columns]]
 
     # Merge PP with DM
     merged = pp_df.merge(dm_sub, on="USUBJID", how="inner")
 
     # Map SETCD to dose_level
     if "SETCD" in merged.columns:
-        setcd_dose_map = _build_setcd_dose_map(dm_df, dose_groups, tk_setcds=tk_setcds)
-        merged["dose_level"] = merged["SETCD"].map(setcd_dose_map)
         # Filter to TK subjects only (those with a TK SETCD that maps to a dose)
-        merged = merged.dropna(subset=["dose_level"])
+        merged = merged.assign(
+            dose_level=merged["SETCD"].map(setcd_map),
+        ).dropna(subset=["dose_level"])
         merged["dose_level"] = merged["dose_level"].astype(int)
     elif "ARMCD" in merged.columns:
         # Fallback: map ARMCD to dose_level
@@ -1786,7 +1850,7 @@ def _link_pooled_tk_to_dose(
     pp_df: pd.DataFrame,
     dm_df: pd.DataFrame,
     dose_groups: list[dict],
-    tk_setcds: set[str] | None = None,
+    setcd_map: dict,
     pooldef_df: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """Resolve pooled PP rows to dose groups via POOLDEF -> DM lookup.
@@ -1820,7 +1884,7 @@ def _link_pooled_tk_to_dose(
         dm_cols.append("SETCD")
     if "ARMCD" in dm_df.columns:
         dm_cols.append("ARMCD")
-    dm_sub = dm_df[[c for c in dm_cols if c in dm_df.columns]].copy()
+    dm_sub = dm_df[[c for c in dm_cols if c in dm_df.columns]]
 
     merged = merged.merge(
         dm_sub, left_on="_REP_USUBJID", right_on="USUBJID", how="inner",
@@ -1831,9 +1895,9 @@ def _link_pooled_tk_to_dose(
 
     # Map SETCD to dose_level
     if "SETCD" in merged.columns:
-        setcd_dose_map = _build_setcd_dose_map(dm_df, dose_groups, tk_setcds=tk_setcds)
-        merged["dose_level"] = merged["SETCD"].map(setcd_dose_map)
-        merged = merged.dropna(subset=["dose_level"])
+        merged = merged.assign(
+            dose_level=merged["SETCD"].map(setcd_map),
+        ).dropna(subset=["dose_level"])
         merged["dose_level"] = merged["dose_level"].astype(int)
     elif "ARMCD" in merged.columns:
         armcd_map = {}
@@ -1875,6 +1939,8 @@ def _build_setcd_dose_map(
 
     all_setcds = dm_df["SETCD"].dropna().unique()
     resolved = set(tk_setcds) if tk_setcds else set()
+    # First ARMCD per stripped SETCD, built on first use by the fallback
+    armcd_by_setcd = None
 
     for setcd in all_setcds:
         s = str(setcd).strip()
@@ -1894,9 +1960,12 @@ def _build_setcd_dose_map(
 
         # Fallback: match via ARMCD from DM
         if "ARMCD" in dm_df.columns:
-            set_rows = dm_df[dm_df["SETCD"].astype(str).str.strip() == s]
-            if not set_rows.empty:
-                armcd = str(set_rows["ARMCD"].iloc[0]).strip()
+            if armcd_by_setcd is None:
+                setcd_str = dm_df["SETCD"].astype(str).str.strip()
+                first = ~setcd_str.duplicated()
+                armcd_by_setcd = dict(zip(setcd_str[first], dm_df["ARMCD"][first]))
+            if s in armcd_by_setcd:
+                armcd = str(armcd_by_setcd[s]).strip()
                 if armcd in armcd_to_dose:
                     setcd_dose[s] = armcd_to_dose[armcd]
 
@@ -1913,7 +1982,7 @@ def _build_dose_group_stats(
     dose_groups: list[dict],
     tk_design: dict,
     lloq: float | None,
-    tk_setcds: set[str] | None = None,
+    setcd_map: dict,
 ) -> list[dict]:
     """Build per-dose-group PK parameter stats and concentration-time profiles."""
     results = []
@@ -1928,41 +1997,54 @@ def _build_dose_group_stats(
         }
 
     # Concentration-time data per dose
-    conc_time_by_dose = _compute_concentration_time(
-        pc_df, dm_df, dose_groups, lloq, tk_setcds=tk_setcds,
-    )
+    conc_time_by_dose = _compute_concentration_time(pc_df, dm_df, lloq, setcd_map)
+
+    n_subjects_by_dose = pp_merged.groupby("dose_level")["USUBJID"].nunique()
+
+    # Coerce PPSTRESN once and locate every (dose, param) cell in a single
+    # groupby pass; the reductions below still run on each cell's own
+    # values. Params are ordered by first row within each dose, as before.
+    cells_by_dose: dict = {}
+    if "PPTESTCD" in pp_merged.columns and "PPSTRESN" in pp_merged.columns:
+        pp_vals = pd.to_numeric(pp_merged["PPSTRESN"], errors="coerce")
+        pp_units = pp_merged[["PPSTRESU"]] if "PPSTRESU" in pp_merged.columns else pp_merged[[]]
+        cells = pp_merged.groupby(["dose_level", "PPTESTCD"], sort=False).indices
+        for (dose_level, param), idx in cells.items():
+            cells_by_dose.setdefault(dose_level, []).append((param, idx))
+        for dose_cells in cells_by_dose.values():
+            dose_cells.sort(key=lambda cell: cell[1][0])
 
     for dose_level in sorted(pp_merged["dose_level"].unique()):
-        dose_data = pp_merged[pp_merged["dose_level"] == dose_level]
-        n_subjects = int(dose_data["USUBJID"].nunique())
+        n_subjects = int(n_subjects_by_dose[dose_level])
         di = dose_info.get(dose_level, {})
 
         # Compute stats per parameter
         parameters = {}
-        if "PPTESTCD" in dose_data.columns and "PPSTRESN" in dose_data.columns:
-            for param in dose_data["PPTESTCD"].unique():
-                param_str = str(param).upper()
-                param_data = dose_data[dose_data["PPTESTCD"] == param]
-                vals = pd.to_numeric(param_data["PPSTRESN"], errors="coerce").dropna()
+        for param, idx in cells_by_dose.get(dose_level, ()):
+            param_str = str(param).upper()
+            vals = pp_vals.iloc[idx].dropna()
 
-                # Filter out negative values for AUCIFO (extrapolation failures)
-                if param_str == "AUCIFO":
-                    vals = vals[vals >= 0]
+            # Filter out negative values for AUCIFO (extrapolation failures)
+            if param_str == "AUCIFO":
+                vals = vals[vals >= 0]
 
-                if vals.empty:
-                    continue
+            if vals.empty:
+                continue
 
-                unit = _get_unique_val(param_data, "PPSTRESU", fallback="")
-                values = [round(float(v), 4) for v in vals]
+            unit = _get_unique_val(pp_units.iloc[idx], "PPSTRESU", fallback="")
 
-                parameters[param_str] = {
-                    "mean": round(float(vals.mean()), 4) if len(vals) > 0 else None,
-                    "sd": round(float(vals.std(ddof=1)), 4) if len(vals) > 1 else None,
-                    "median": round(float(vals.median()), 4) if len(vals) > 0 else None,
-                    "n": int(len(vals)),
-                    "unit": str(unit),
-                    "values": values,
-                }
+            # tolist() yields Python floats; round() stays correctly
+            # rounded where np.round would differ on ties.
+            values = [round(v, 4) for v in vals.to_numpy(dtype=float).tolist()]
+
+            parameters[param_str] = {
+                "mean": round(float(vals.mean()), 4) if len(vals) > 0 else None,
+                "sd": round(float(vals.std(ddof=1)), 4) if len(vals) > 1 else None,
+                "median": round(float(vals.median()), 4) if len(vals) > 0 else None,
+                "n": int(len(vals)),
+                "unit": str(unit),
+                "values": values,
+            }
 
         results.append({
             "dose_level": int(dose_level),
@@ -1980,28 +2062,24 @@ def _build_dose_group_stats(
 def _compute_concentration_time(
     pc_df: pd.DataFrame,
     dm_df: pd.DataFrame,
-    dose_groups: list[dict],
     lloq: float | None,
-    tk_setcds: set[str] | None = None,
+    setcd_map: dict,
 ) -> dict[int, list[dict]]:
     """Compute mean concentration-time profiles per dose group."""
     if "USUBJID" not in pc_df.columns or "PCSTRESN" not in pc_df.columns:
         return {}
 
     # Merge PC with DM to get SETCD
-    dm_sub = dm_df[["USUBJID"]].copy()
-    if "SETCD" in dm_df.columns:
-        dm_sub = dm_df[["USUBJID", "SETCD"]].copy()
-
-    pc_merged = pc_df.merge(dm_sub, on="USUBJID", how="inner")
+    dm_cols = ["USUBJID", "SETCD"] if "SETCD" in dm_df.columns else ["USUBJID"]
+    pc_merged = pc_df.merge(dm_df[dm_cols], on="USUBJID", how="inner")
 
     # Map SETCD to dose_level
     if "SETCD" not in pc_merged.columns:
         return {}
 
-    setcd_map = _build_setcd_dose_map(dm_df, dose_groups, tk_setcds=tk_setcds)
-    pc_merged["dose_level"] = pc_merged["SETCD"].map(setcd_map)
-    pc_merged = pc_merged.dropna(subset=["dose_level"])
+    pc_merged = pc_merged.assign(
+        dose_level=pc_merged["SETCD"].map(setcd_map),
+    ).dropna(subset=["dose_level"])
     pc_merged["dose_level"] = pc_merged["dose_level"].astype(int)
 
     # Parse elapsed time from PCELTM (ISO 8601 duration, e.g., "PT0.5H")
@@ -2009,7 +2087,7 @@ def _compute_concentration_time(
     has_pceltm = ("PCELTM" in pc_merged.columns
                   and pc_merged["PCELTM"].astype(str).str.strip().replace("", pd.NA).notna().any())
     if has_pceltm:
-        pc_merged["elapsed_h"] = pc_merged["PCELTM"].apply(_parse_elapsed_time)
+        pc_merged["elapsed_h"] = _parse_elapsed_series(pc_merged["PCELTM"])
     elif "PCTPTNUM" in pc_merged.columns:
         pc_merged["elapsed_h"] = pd.to_numeric(pc_merged["PCTPTNUM"], errors="coerce")
     else:
@@ -2017,9 +2095,13 @@ def _compute_concentration_time(
 
     # Handle BQL: use LLOQ/2
     lloq_half = (lloq / 2) if lloq and lloq > 0 else 0.0
-    pc_merged["conc"] = pd.to_numeric(pc_merged["PCSTRESN"], errors="coerce")
-    pc_merged["is_bql"] = pc_merged["conc"].isna()
-    pc_merged["conc"] = pc_merged["conc"].fillna(lloq_half)
+    conc = pd.to_numeric(pc_merged["PCSTRESN"], errors="coerce").to_numpy(
+        dtype=float, na_value=np.nan, copy=True,
+    )
+    is_bql = np.isnan(conc)
+    np.copyto(conc, lloq_half, where=is_bql)
+    pc_merged["conc"] = conc
+    pc_merged["is_bql"] = is_bql
 
     # Get timepoint labels
     if "PCTPT" in pc_merged.columns:
@@ -2029,35 +2111,38 @@ def _compute_concentration_time(
             lambda h: f"{h:.1f}H" if pd.notna(h) else "Unknown"
         )
 
-    result = {}
-    for dose_level, grp in pc_merged.groupby("dose_level"):
-        dose_level = int(dose_level)
-        timepoints = []
-
-        # Get timepoint number for sorting
-        if "PCTPTNUM" in grp.columns:
-            tp_col = "PCTPTNUM"
-        else:
-            tp_col = "elapsed_h"
-
-        for tp_val, tp_grp in grp.groupby(tp_col):
-            elapsed = tp_grp["elapsed_h"].iloc[0] if "elapsed_h" in tp_grp.columns else None
-            label = tp_grp["timepoint_label"].iloc[0]
-            conc_vals = tp_grp["conc"].dropna()
-            n_bql = int(tp_grp["is_bql"].sum())
-
-            timepoints.append({
-                "timepoint": str(label),
-                "tptnum": int(tp_val) if pd.notna(tp_val) else 0,
-                "elapsed_h": round(float(elapsed), 2) if pd.notna(elapsed) else None,
-                "mean": round(float(conc_vals.mean()), 4) if len(conc_vals) > 0 else 0.0,
-                "sd": round(float(conc_vals.std(ddof=1)), 4) if len(conc_vals) > 1 else 0.0,
-                "n": int(len(tp_grp)),
-                "n_bql": n_bql,
-            })
+    # Get timepoint number for sorting
+    tp_col = "PCTPTNUM" if "PCTPTNUM" in pc_merged.columns else "elapsed_h"
+
+    # One groupby pass over (dose, timepoint) cells, visited in sorted key
+    # order; each cell's rows keep their original order for the first-row
+    # picks and the per-cell reductions. Scalar picks and BQL counts read
+    # plain column arrays; mean/SD stay on Series reductions.
+    cells = pc_merged.groupby(["dose_level", tp_col]).indices
+    elapsed_arr = pc_merged["elapsed_h"].to_numpy()
+    label_arr = pc_merged["timepoint_label"].to_numpy()
+    bql_arr = pc_merged["is_bql"].to_numpy()
+    conc_col = pc_merged["conc"]
+
+    result = {int(d): [] for d in sorted(pc_merged["dose_level"].unique())}
+    for (dose_level, tp_val), idx in sorted(cells.items(), key=lambda kv: kv[0]):
+        elapsed = elapsed_arr[idx[0]]
+        label = label_arr[idx[0]]
+        conc_vals = conc_col.iloc[idx].dropna()
+        n_bql = int(np.count_nonzero(bql_arr[idx]))
+
+        result[int(dose_level)].append({
+            "timepoint": str(label),
+            "tptnum": int(tp_val) if pd.notna(tp_val) else 0,
+            "elapsed_h": round(float(elapsed), 2) if pd.notna(elapsed) else None,
+            "mean": round(float(conc_vals.mean()), 4) if len(conc_vals) > 0 else 0.0,
+            "sd": round(float(conc_vals.std(ddof=1)), 4) if len(conc_vals) > 1 else 0.0,
+            "n": int(len(idx)),
+            "n_bql": n_bql,
+        })
 
+    for timepoints in result.values():
         timepoints.sort(key=lambda t: t["elapsed_h"] if t["elapsed_h"] is not None else 0)
-        result[dose_level] = timepoints
 
     return result
 
@@ -2097,16 +2182,17 @@ def _compute_dose_proportionality(
             "interpretation": None,
         }
 
-    doses = []
-    aucs = []
-    dose_levels_used = []
-    for g in by_dose_group:
-        dose_val = g.get("dose_value")
-        auc_mean = g["parameters"].get(param, {}).get("mean")
-        if dose_val and dose_val > 0 and auc_mean and auc_mean > 0:
-            doses.append(dose_val)
-            aucs.append(auc_mean)
-            dose_levels_used.append(g["dose_level"])
+    used = [
+        (dose_val, auc_mean, g["dose_level"])
+        for g in by_dose_group
+        for dose_val, auc_mean in [
+            (g.get("dose_value"), g["parameters"].get(param, {}).get("mean"))
+        ]
+        if dose_val and dose_val > 0 and auc_mean and auc_mean > 0
+    ]
+    doses = [u[0] for u in used]
+    aucs = [u[1] for u in used]
+    dose_levels_used = [u[2] for u in used]
 
     if len(doses) < 3:
         return {
@@ -2119,14 +2205,13 @@ def _compute_dose_proportionality(
             "interpretation": None,
         }
 
-    log_doses = [math.log(d) for d in doses]
-    log_aucs = [math.log(a) for a in aucs]
+    # math.log, not np.log: numpy's SIMD log is not correctly rounded and
+    # would shift the fitted slope in the last bits.
+    log_doses = list(map(math.log, doses))
+    log_aucs = list(map(math.log, aucs))
 
-    # Linear regression on log-log scale (scipy gives SE on slope, polyfit doesn't)
-    lr = scipy_stats.linregress(log_doses, log_aucs)
-    slope = float(lr.slope)
-    se_slope = float(lr.stderr) if lr.stderr is not None else None
-    r_squared = float(lr.rvalue) ** 2
+    # Linear regression on log-log scale (slope with its standard error)
+    slope, se_slope, r_squared = _loglog_regression(log_doses, log_aucs)
 
     # Non-monotonicity: AUC drops between consecutive dose groups
     non_monotonic = False
@@ -2193,6 +2278,28 @@ def _compute_dose_proportionality(
     }
 
 
+def _loglog_regression(x: list[float], y: list[float]) -> tuple[float, float, float]:
+    """Least-squares slope, slope standard error and R^2 for n >= 3 points.
+
+    Same arithmetic as scipy.stats.linregress (np.cov moments, r clamped to
+    [-1, 1]) minus its p-value, whose Student-t evaluation dominated the
+    call and is never reported here.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if np.amax(x) == np.amin(x):
+        raise ValueError("Cannot calculate a linear regression if all x values are identical")
+
+    ssxm, ssxym, _, ssym = np.cov(x, y, bias=1).flat
+    if ssxm == 0.0 or ssym == 0.0:
+        r = np.nan if ssxym == 0 else 0.0
+    else:
+        r = min(max(ssxym / np.sqrt(ssxm * ssym), -1.0), 1.0)
+    slope = ssxym / ssxm
+    slope_stderr = np.sqrt((1 - r**2) * ssym / ssxm / (len(x) - 2))
+    return float(slope), float(slope_stderr), float(r) ** 2
+
+
 def _classify_dose_normalized_auc(auc_per_dose: list[float]) -> str:
     """Classify dose-normalized AUC profile shape (F1).
 
@@ -2369,16 +2476,17 @@ def _iter_visits_by_dose(pp_merged: pd.DataFrame) -> dict:
     if visit_col is None:
         return {}
 
-    auc_param = None
+    # Normalize PPTESTCD once; each candidate is then a plain equality mask
+    testcd = _upper_by_value(pp_merged["PPTESTCD"])
+    auc_rows = None
     for candidate in ("AUCLST", "AUCTAU", "AUCALL"):
-        rows = pp_merged[pp_merged["PPTESTCD"].astype(str).str.upper() == candidate]
+        rows = pp_merged[testcd == candidate]
         if not rows.empty and rows["dose_level"].nunique() >= 1:
-            auc_param = candidate
+            auc_rows = rows
             break
-    if auc_param is None:
+    if auc_rows is None:
         return {}
 
-    auc_rows = pp_merged[pp_merged["PPTESTCD"].astype(str).str.upper() == auc_param].copy()
     auc_rows["_auc_val"] = pd.to_numeric(auc_rows["PPSTRESN"], errors="coerce")
     auc_rows["_visit"] = pd.to_numeric(auc_rows[visit_col], errors="coerce")
     auc_rows = auc_rows.dropna(subset=["_auc_val", "_visit"])
@@ -2404,8 +2512,9 @@ def _get_half_life_h_for_dose(pp_merged: pd.DataFrame, dose_level: int) -> float
     sub = pp_merged[pp_merged["dose_level"] == dose_level]
     if sub.empty:
         return None
+    testcd = _upper_by_value(sub["PPTESTCD"])
     for param in _HALF_LIFE_PARAM_CANDIDATES:
-        rows = sub[sub["PPTESTCD"].astype(str).str.upper() == param]
+        rows = sub[testcd == param]
         if rows.empty:
             continue
         vals = pd.to_numeric(rows["PPSTRESN"], errors="coerce").dropna()
@@ -2715,23 +2824,28 @@ def _check_tk_survivorship(
     if not high_dose_tk_code:
         return None
 
-    tk_subjects = set(dm_df[dm_df["SETCD"] == high_dose_tk_code]["USUBJID"])
+    # One grouping pass over DM.SETCD serves all three set lookups below
+    rows_by_setcd = dm_df.groupby("SETCD", sort=False).indices
+    usubjid = dm_df["USUBJID"]
+
+    def _subjects(code: str) -> set:
+        idx = rows_by_setcd.get(code)
+        return set(usubjid.iloc[idx]) if idx is not None else set()
+
+    tk_subjects = _subjects(high_dose_tk_code)
 
     # Main study subjects at same dose level (SETCD without TK suffix)
     main_code = high_dose_tk_code.replace("TK", "")
-    main_subjects = set(dm_df[dm_df["SETCD"] == main_code]["USUBJID"])
     # Also check recovery subjects (e.g., "4R")
     recovery_code = main_code + "R"
-    if "SETCD" in dm_df.columns:
-        recovery_subs = set(dm_df[dm_df["SETCD"] == recovery_code]["USUBJID"])
-        main_subjects = main_subjects | recovery_subs
+    main_subjects = _subjects(main_code) | _subjects(recovery_code)
 
     # Check for deaths in DS domain
     death_codes = {"MORIBUND SACRIFICE", "FOUND DEAD", "DIED"}
     dead_subjects = set()
     if "DSDECOD" in ds_df.columns:
         dead_subjects = set(
-            ds_df[ds_df["DSDECOD"].str.upper().isin(death_codes)]["USUBJID"]
+            ds_df[_upper_by_value(ds_df["DSDECOD"]).isin(death_codes)]["USUBJID"]
         )
 
     tk_deaths = tk_subjects & dead_subjects
@@ -2753,12 +2867,11 @@ def _check_tk_survivorship(
 
 def _get_species(study: StudyInfo) -> str | None:
     """Get species from TS domain."""
-    if "ts" not in study.xpt_files:
+    ts_df = _read_domain(study, "ts")
+    if ts_df is None:
         return None
     try:
-        ts_df, _ = read_xpt(study.xpt_files["ts"])
-        ts_df.columns = [c.upper() for c in ts_df.columns]
-        species_rows = ts_df[ts_df["TSPARMCD"].str.upper() == "SPECIES"]
+        species_rows = ts_df[_upper_by_value(ts_df["TSPARMCD"]) == "SPECIES"]
         if not species_rows.empty:
             return str(species_rows.iloc[0].get("TSVAL", "")).strip().upper() or None
     except Exception:
@@ -2784,14 +2897,17 @@ def _get_noael_loael_levels(noael: list[dict]) -> tuple[int | None, int | None,
 
 
 def _extract_exposure_at_dose(
-    by_dose_group: list[dict],
+    dose_index: dict[int, dict],
     dose_level: int | None,
 ) -> dict | None:
-    """Extract exposure summary at a specific dose level."""
+    """Extract exposure summary at a specific dose level.
+
+    dose_index maps dose_level to its by_dose_group entry.
+    """
     if dose_level is None:
         return None
 
-    group = next((g for g in by_dose_group if g["dose_level"] == dose_level), None)
+    group = dose_index.get(dose_level)
     if group is None:
         return None
 
@@ -2864,7 +2980,8 @@ def _get_unique_val(df: pd.DataFrame, col: str, fallback: str = "") -> str:
     vals = df[col].dropna()
     if vals.empty:
         return fallback
-    return str(vals.mode().iloc[0]) if not vals.mode().empty else str(vals.iloc[0])
+    modes = vals.mode()
+    return str(modes.iloc[0]) if not modes.empty else str(vals.iloc[0])
 
 
 def _get_lloq(pc_df: pd.DataFrame) -> tuple[float | None, str | None]:
@@ -2908,6 +3025,29 @@ def _get_available_params(pp_merged: pd.DataFrame) -> list[str]:
     return ordered + extras
 
 
+def _upper_by_value(col: pd.Series) -> pd.Series:
+    """Uppercase a key/filter column (TESTCD, DSDECOD, ...) once per distinct value.
+
+    Same factorize-and-broadcast shape as _parse_elapsed_series; missing
+    values stay missing, so equality and isin masks match a .str.upper().
+    """
+    codes, uniques = pd.factorize(col)
+    upper = np.array([str(u).upper() for u in uniques] + [None], dtype=object)
+    return pd.Series(upper[codes], index=col.index)
+
+
+def _parse_elapsed_series(pceltm: pd.Series) -> pd.Series:
+    """Parse a PCELTM column to hours, one _parse_elapsed_time call per distinct value.
+
+    Elapsed-time columns repeat a handful of nominal timepoints, so parsing
+    the factorized uniques and broadcasting back through the codes matches
+    a per-row apply. Missing values map to NaN.
+    """
+    codes, uniques = pd.factorize(pceltm)
+    parsed = np.array([_parse_elapsed_time(u) for u in uniques] + [None], dtype=float)
+    return pd.Series(parsed[codes], index=pceltm.index)
+
+
 def _parse_elapsed_time(pceltm) -> float | None:
     """Parse ISO 8601 duration string to hours.
 
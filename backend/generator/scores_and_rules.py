@@ -3,81 +3,136 @@
 Evaluates 19 canonical rules and emits structured rule results.
 """
 
+import heapq
 import logging
-from collections import defaultdict
+import math
+import string
+import sys
+from bisect import bisect_right
+from collections import ChainMap, defaultdict
+from dataclasses import dataclass, field, replace
 
 from services.analysis.clinical_catalog import apply_clinical_layer
 
 logger = logging.getLogger(__name__)
 
 
-RULES = [
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """A canonical rule definition.
+
+    `fields` holds the template's placeholder names, parsed once at
+    definition; _emit* render with str.format_map(ctx), which reads the
+    context mapping without a kwargs copy. A template with no replacement
+    fields at all has its final text precomputed in `static_text` and is
+    never formatted. `result_template` is the rule's static output-dict
+    head (keys in output order); _emit* copy it and fill the per-hit slots.
+    """
+    id: str
+    scope: str
+    severity: str
+    condition: str
+    template: str
+    fields: tuple[str, ...] = field(init=False)
+    static_text: str | None = field(init=False)
+    result_template: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Interned so suppression-pass set lookups on rule_id hit the
+        # identity fast path, whatever built the result dict.
+        for name in ("id", "scope", "severity"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        parsed = list(string.Formatter().parse(self.template))
+        object.__setattr__(self, "fields", tuple(name for _, name, _, _ in parsed if name))
+        object.__setattr__(self, "static_text", (
+            "".join(literal for literal, _, _, _ in parsed)
+            if all(name is None for _, name, _, _ in parsed) else None
+        ))
+        object.__setattr__(self, "result_template", {
+            "rule_id": self.id,
+            "scope": self.scope,
+            "severity": self.severity,
+            "context_key": "",
+            "organ_system": "",
+            "output_text": "",
+            "evidence_refs": None,
+            "params": None,
+        })
+
+    def render(self, ctx) -> str:
+        """Format the template against a context mapping."""
+        if self.static_text is not None:
+            return self.static_text
+        return self.template.format_map(ctx)
+
+
+RULES: list[Rule] = [
     # Treatment-related rules
-    {"id": "R01", "scope": "endpoint", "severity": "info",
-     "condition": "treatment_related",
-     "template": "{endpoint_label}: significant dose-dependent {direction} in {sex} ({pattern})."},
-    {"id": "R02", "scope": "endpoint", "severity": "info",
-     "condition": "significant_pairwise",
-     "template": "Significant pairwise difference at {dose_label} (p={p_value:.4f}, d={effect_size:.2f})."},
-    {"id": "R03", "scope": "endpoint", "severity": "info",
-     "condition": "significant_trend",
-     "template": "Significant dose-response trend (p={trend_p:.4f})."},
-    {"id": "R04", "scope": "endpoint", "severity": "warning",
-     "condition": "adverse_severity",
-     "template": "{endpoint_label} classified as adverse in {sex} (p={p_value:.4f})."},
+    Rule(id="R01", scope="endpoint", severity="info",
+         condition="treatment_related",
+         template="{endpoint_label}: significant dose-dependent {direction} in {sex} ({pattern})."),
+    Rule(id="R02", scope="endpoint", severity="info",
+         condition="significant_pairwise",
+         template="Significant pairwise difference at {dose_label} (p={p_value:.4f}, d={effect_size:.2f})."),
+    Rule(id="R03", scope="endpoint", severity="info",
+         condition="significant_trend",
+         template="Significant dose-response trend (p={trend_p:.4f})."),
+    Rule(id="R04", scope="endpoint", severity="warning",
+         condition="adverse_severity",
+         template="{endpoint_label} classified as adverse in {sex} (p={p_value:.4f})."),
 
     # Dose-response pattern rules
-    {"id": "R05", "scope": "endpoint", "severity": "info",
-     "condition": "monotonic_pattern",
-     "template": "{endpoint_label}: {pattern} across dose groups in {sex}."},
-    {"id": "R06", "scope": "endpoint", "severity": "info",
-     "condition": "threshold_pattern",
-     "template": "{endpoint_label}: threshold pattern in {sex}."},
-    {"id": "R07", "scope": "endpoint", "severity": "info",
-     "condition": "non_monotonic",
-     "template": "{endpoint_label}: inconsistent dose-response in {sex}."},
+    Rule(id="R05", scope="endpoint", severity="info",
+         condition="monotonic_pattern",
+         template="{endpoint_label}: {pattern} across dose groups in {sex}."),
+    Rule(id="R06", scope="endpoint", severity="info",
+         condition="threshold_pattern",
+         template="{endpoint_label}: threshold pattern in {sex}."),
+    Rule(id="R07", scope="endpoint", severity="info",
+         condition="non_monotonic",
+         template="{endpoint_label}: inconsistent dose-response in {sex}."),
 
     # Target organ rules
-    {"id": "R08", "scope": "organ", "severity": "warning",
-     "condition": "target_organ",
-     "template": "Convergent evidence from {n_domains} domains ({domains})."},
-    {"id": "R09", "scope": "organ", "severity": "info",
-     "condition": "multi_domain_evidence",
-     "template": "{n_endpoints} endpoints across {domains}."},
+    Rule(id="R08", scope="organ", severity="warning",
+         condition="target_organ",
+         template="Convergent evidence from {n_domains} domains ({domains})."),
+    Rule(id="R09", scope="organ", severity="info",
+         condition="multi_domain_evidence",
+         template="{n_endpoints} endpoints across {domains}."),
 
     # Effect magnitude rules (domain-aware label via effect_size_label)
-    {"id": "R10", "scope": "endpoint", "severity": "warning",
-     "condition": "large_effect",
-     "template": "{endpoint_label}: {effect_metric} = {effect_size:.2f} at high dose in {sex}."},
-    {"id": "R11", "scope": "endpoint", "severity": "info",
-     "condition": "moderate_effect",
-     "template": "{endpoint_label}: {effect_metric} = {effect_size:.2f} at high dose."},
+    Rule(id="R10", scope="endpoint", severity="warning",
+         condition="large_effect",
+         template="{endpoint_label}: {effect_metric} = {effect_size:.2f} at high dose in {sex}."),
+    Rule(id="R11", scope="endpoint", severity="info",
+         condition="moderate_effect",
+         template="{endpoint_label}: {effect_metric} = {effect_size:.2f} at high dose."),
 
     # Histopathology rules
-    {"id": "R12", "scope": "endpoint", "severity": "warning",
-     "condition": "histo_incidence_increase",
-     "template": "Increased incidence of {finding} in {specimen} at high dose ({sex})."},
-    {"id": "R13", "scope": "endpoint", "severity": "info",
-     "condition": "severity_grade_increase",
-     "template": "{finding} in {specimen}: dose-dependent severity increase."},
+    Rule(id="R12", scope="endpoint", severity="warning",
+         condition="histo_incidence_increase",
+         template="Increased incidence of {finding} in {specimen} at high dose ({sex})."),
+    Rule(id="R13", scope="endpoint", severity="info",
+         condition="severity_grade_increase",
+         template="{finding} in {specimen}: dose-dependent severity increase."),
 
     # NOAEL rules
-    {"id": "R14", "scope": "study", "severity": "info",
-     "condition": "noael_established",
-     "template": "NOAEL at {noael_label} ({noael_dose_value} {noael_dose_unit}) for {sex}."},
-    {"id": "R15", "scope": "study", "severity": "warning",
-     "condition": "noael_not_established",
-     "template": "NOAEL not established for {sex} \u2014 adverse effects at lowest dose tested."},
+    Rule(id="R14", scope="study", severity="info",
+         condition="noael_established",
+         template="NOAEL at {noael_label} ({noael_dose_value} {noael_dose_unit}) for {sex}."),
+    Rule(id="R15", scope="study", severity="warning",
+         condition="noael_not_established",
+         template="NOAEL not established for {sex} \u2014 adverse effects at lowest dose tested."),
 
     # Correlation rules
-    {"id": "R16", "scope": "organ", "severity": "info",
-     "condition": "correlated_findings",
-     "template": "{endpoint_labels} show convergent pattern."},
+    Rule(id="R16", scope="organ", severity="info",
+         condition="correlated_findings",
+         template="{endpoint_labels} show convergent pattern."),
 
     # Mortality rule
-    {"id": "R17", "scope": "study", "severity": "critical",
-     "condition": "mortality_signal",
-     "template": "{count} deaths in {sex}, dose-dependent pattern."},
+    Rule(id="R17", scope="study", severity="critical",
+         condition="mortality_signal",
+         template="{count} deaths in {sex}, dose-dependent pattern."),
 
     # R18/R19 protective rules — removed. Now emitted as synthetic rule_results
     # from protective_syndromes.py output via _emit_protective_rule_results().
@@ -85,6 +140,40 @@ RULES = [
     # are never referenced after this change — all R18/R19 emission is synthetic).
 ]
 
+RULES_BY_ID: dict[str, Rule] = {r.id: r for r in RULES}
+(R01, R02, R03, R04, R05, R06, R07, R08, R09, R10, R11, R12, R13, R14, R15,
+ R16, R17) = RULES
+
+
+# R10 for single-affected findings: severity downgraded to info
+_R10_DAMPENED = replace(R10, severity="info")
+
+# Legacy |g| gates used when no FCT entry covers the endpoint:
+# bisect_right level 1 -> R11 (0.5 <= |g| < 1.0), level 2 -> R10 (|g| >= 1.0)
+_ES_THRESHOLDS = (0.5, 1.0)
+
+_HISTO_DOMAINS = frozenset(("MI", "MA", "CL"))
+
+# dose_response_pattern -> bit flags, decoded once per finding so the
+# R05-R07 and R13 branches test ints instead of string tuples
+_PAT_MONOTONIC = 1
+_PAT_THRESHOLD = 2
+_PAT_NON_MONOTONIC = 4
+_PAT_INCREASE = 8
+_PATTERN_FLAGS = {
+    "monotonic_increase": _PAT_MONOTONIC | _PAT_INCREASE,
+    "monotonic_decrease": _PAT_MONOTONIC,
+    "threshold_increase": _PAT_THRESHOLD | _PAT_INCREASE,
+    "threshold_decrease": _PAT_THRESHOLD,
+    "non_monotonic": _PAT_NON_MONOTONIC,
+}
+
+# Suppression trigger rule -> rule ids it removes within the same context_key
+_SUPPRESSES = {
+    "R01": frozenset(("R07",)),
+    "R04": frozenset(("R01", "R03")),
+}
+
 
 def _emit_protective_rule_results(
     protective_syndromes: dict,
@@ -134,35 +223,29 @@ def _emit_protective_rule_results(
             params["bayesian_p_less"] = gate.get("bayesian_p_less")
             params["spared_cases"] = gate.get("spared_cases")
 
-        sex = endpoints[0].get("sex", "") if endpoints else ""
-        finding_label = endpoints[0].get("endpoint_label", "") if endpoints else ""
-        specimen = endpoints[0].get("specimen", "") if endpoints else ""
+        lead = endpoints[0] if endpoints else {}
+        sex = lead.get("sex", "")
+        finding_label = lead.get("endpoint_label", "")
+        specimen = lead.get("specimen", "")
 
-        severity = "info"
-        if sid == "R18":
-            condition = "histo_incidence_decrease"
-            template = (
-                f"Protective pattern: {match.get('name', '')} detected "
-                f"in {sex}. Evidence tier: {tier}."
-            )
-        else:
-            condition = "potential_protective_effect"
-            template = (
-                f"Protective pattern: {match.get('name', '')} detected "
-                f"in {sex}. Evidence tier: {tier}."
-            )
+        # R18 and R19 share the message; only the condition differs
+        condition = "histo_incidence_decrease" if sid == "R18" else "potential_protective_effect"
+        template = (
+            f"Protective pattern: {match.get('name', '')} detected "
+            f"in {sex}. Evidence tier: {tier}."
+        )
 
         result = {
             "rule_id": sid,
             "scope": "endpoint",
-            "severity": severity,
+            "severity": "info",
             "condition": condition,
             "message": template,
             "context_key": f"{finding_label}_{specimen}_{sex}",
             "endpoint_label": finding_label,
             "specimen": specimen,
             "sex": sex,
-            "domain": endpoints[0].get("domain", "") if endpoints else "",
+            "domain": lead.get("domain", ""),
             "params": params,
             "evidence_tier": tier,
             "source": "S11_protective",
@@ -187,50 +270,76 @@ def evaluate_rules(
             Supported keys: species, strain, study_start_year,
             duration_category, enable_alpha_cell_scaling.
     """
+    from services.analysis.send_knowledge import get_effect_size as _get_es
+
     results = []
+    # Rule ids whose template failed to render in this call (logged once each)
+    warned: set[str] = set()
     dose_label_map = {dg["dose_level"]: dg["label"] for dg in dose_groups}
 
+    # Filled during the endpoint pass so the organ (R16) and mortality (R17)
+    # rules below do not sweep findings again.
+    findings_by_organ = defaultdict(list)
+    mortality_findings = []
+
     for finding in findings:
+        # Fields read by several rules below, looked up once per finding
+        fget = finding.get
+        domain = fget("domain")
+        pattern = fget("dose_response_pattern", "")
+        pattern_flags = _PATTERN_FLAGS.get(pattern, 0)
+        severity = fget("severity")
+        trend_p = fget("trend_p")
+        findings_by_organ[fget("organ_system")].append(finding)
+        if domain == "DS" and fget("test_code") == "MORTALITY":
+            mortality_findings.append(finding)
+
         ctx = _build_finding_context(finding, dose_label_map)
+        # group_stats aggregates shared by every rule emitted for this finding
+        gs = fget("group_stats", [])
+        n_aff = sum(g.get("affected", 0) for g in gs if g.get("dose_level", 0) > 0)
+        row = _finding_row(finding, n_aff, max((g.get("n", 0) for g in gs), default=0))
 
         # R01: Treatment-related
-        if finding.get("treatment_related"):
-            results.append(_emit(RULES[0], ctx, finding,
-                                 params={"pattern": finding.get("dose_response_pattern", "")}))
+        if fget("treatment_related"):
+            results.append(_emit(R01, ctx, row, warned,
+                                 params={"pattern": pattern}))
 
-        # R02: Significant pairwise
-        for pw in finding.get("pairwise", []):
+        # R02: Significant pairwise. Pairwise lists are one entry per
+        # treated dose group (typically 3), so a plain scan is cheaper
+        # than batching the p-values into an array.
+        for pw in fget("pairwise", ()):
             p = pw.get("p_value_adj", pw.get("p_value"))
             if p is not None and p < 0.05:
-                pw_ctx = {**ctx, "dose_label": dose_label_map.get(pw["dose_level"], ""),
-                          "p_value": p, "effect_size": pw.get("effect_size", 0) or 0}
-                results.append(_emit(RULES[1], pw_ctx, finding))
+                results.append(_emit(R02, ctx, row, warned, overrides={
+                    "dose_label": dose_label_map.get(pw["dose_level"], ""),
+                    "p_value": p, "effect_size": pw.get("effect_size", 0) or 0,
+                }))
 
         # R03: Significant trend
-        if finding.get("trend_p") is not None and finding["trend_p"] < 0.05:
-            results.append(_emit(RULES[2], {**ctx, "trend_p": finding["trend_p"]}, finding))
+        if trend_p is not None and trend_p < 0.05:
+            results.append(_emit(R03, ctx, row, warned, overrides={"trend_p": trend_p}))
 
         # R04: Adverse severity
-        if finding.get("severity") == "adverse":
-            best_p = finding.get("min_p_adj", 0) or 0
-            fc = finding.get("finding_class")
+        if severity == "adverse":
+            best_p = fget("min_p_adj", 0) or 0
+            fc = fget("finding_class")
             r04_params = {}
             if fc is not None:
                 r04_params["finding_class"] = fc
                 if fc != "tr_adverse":
                     r04_params["finding_class_disagrees"] = True
-            results.append(_emit(RULES[3], {**ctx, "p_value": best_p}, finding,
-                                 params=r04_params))
+            results.append(_emit(R04, ctx, row, warned, params=r04_params,
+                                 overrides={"p_value": best_p}))
 
         # R05-R07: Dose-response patterns
-        pattern = finding.get("dose_response_pattern", "")
-        if pattern in ("monotonic_increase", "monotonic_decrease"):
-            results.append(_emit(RULES[4], {**ctx, "pattern": pattern}, finding,
-                                 params={"pattern": pattern}))
-        elif pattern in ("threshold_increase", "threshold_decrease"):
-            results.append(_emit(RULES[5], ctx, finding))
-        elif pattern == "non_monotonic":
-            results.append(_emit(RULES[6], ctx, finding))
+        if pattern_flags & _PAT_MONOTONIC:
+            results.append(_emit(R05, ctx, row, warned, params={"pattern": pattern},
+                                 overrides={"pattern": pattern}))
+        elif pattern_flags & _PAT_THRESHOLD:
+            results.append(_emit(R06, ctx, row, warned))
+        elif pattern_flags & _PAT_NON_MONOTONIC:
+            results.append(_emit(R07, ctx, row, warned))
 
         # R10-R11: Effect magnitude (continuous domains only -- Hedges' g fallback).
         # For MI, max_effect_size is avg_severity (1-5) not Hedges' g -- skip magnitude rules.
@@ -244,53 +353,51 @@ def evaluate_rules(
         # pending per-domain FCT population. Rule payload threads the
         # uncertainty-first fields (coverage/fallback_used/provenance/
         # entry_ref) regardless of which path fired.
-        from services.analysis.send_knowledge import get_effect_size as _get_es
         es = _get_es(finding)
         if es is not None:
-            gs_r10 = finding.get("group_stats", [])
-            n_aff = sum(g.get("affected", 0) for g in gs_r10 if g.get("dose_level", 0) > 0)
-            verdict = finding.get("verdict")
-            coverage = finding.get("coverage") or "none"
+            verdict = fget("verdict")
+            coverage = fget("coverage") or "none"
             fct_fires_r10 = verdict in ("adverse", "strong_adverse") and coverage != "none"
             fct_fires_r11 = verdict == "concern" and coverage != "none"
             fct_reliance_extra = {
                 "fct_coverage": coverage,
-                "fct_fallback_used": finding.get("fallback_used"),
-                "fct_provenance": finding.get("provenance"),
-                "fct_entry_ref": finding.get("entry_ref"),
+                "fct_fallback_used": fget("fallback_used"),
+                "fct_provenance": fget("provenance"),
+                "fct_entry_ref": fget("entry_ref"),
                 "fct_verdict": verdict,
             }
 
-            fires_r10 = fct_fires_r10 or (not fct_fires_r10 and coverage == "none" and abs(es) >= 1.0)
-            fires_r11 = (not fires_r10) and (
-                fct_fires_r11 or (coverage == "none" and 0.5 <= abs(es) < 1.0)
+            legacy_level = (
+                bisect_right(_ES_THRESHOLDS, abs(es))
+                if coverage == "none" and not math.isnan(es) else 0
             )
+            fires_r10 = fct_fires_r10 or legacy_level == 2
+            fires_r11 = (not fires_r10) and (fct_fires_r11 or legacy_level == 1)
 
             if fires_r10:
                 extra = {"effect_size": es, "n_affected": n_aff, **fct_reliance_extra}
                 if n_aff <= 1:
                     # Dampen: single-animal finding -- mathematically correct but
                     # statistically meaningless, so downgrade to info severity
-                    dampened_rule = {**RULES[9], "severity": "info"}
                     extra["dampened"] = True
                     extra["dampening_reason"] = "single_affected"
-                    results.append(_emit(dampened_rule, {**ctx, "effect_size": es}, finding,
-                                         params=extra))
+                    results.append(_emit(_R10_DAMPENED, ctx, row, warned, params=extra,
+                                         overrides={"effect_size": es}))
                 else:
-                    results.append(_emit(RULES[9], {**ctx, "effect_size": es}, finding,
-                                         params=extra))
+                    results.append(_emit(R10, ctx, row, warned, params=extra,
+                                         overrides={"effect_size": es}))
             elif fires_r11:
                 r11_params = {"effect_size": es, "n_affected": n_aff, **fct_reliance_extra}
-                results.append(_emit(RULES[10], {**ctx, "effect_size": es}, finding,
-                                     params=r11_params))
+                results.append(_emit(R11, ctx, row, warned, params=r11_params,
+                                     overrides={"effect_size": es}))
 
         # R12-R13: Histopathology — incidence increase / severity increase
-        if finding.get("domain") in ("MI", "MA", "CL"):
-            if finding.get("direction") == "up" and finding.get("severity") != "normal":
-                results.append(_emit(RULES[11], ctx, finding))
-            if finding.get("dose_response_pattern") in ("monotonic_increase", "threshold_increase"):
-                if finding.get("avg_severity") is not None:
-                    results.append(_emit(RULES[12], ctx, finding))
+        if domain in _HISTO_DOMAINS:
+            if fget("direction") == "up" and severity != "normal":
+                results.append(_emit(R12, ctx, row, warned))
+            if pattern_flags & _PAT_INCREASE:
+                if fget("avg_severity") is not None:
+                    results.append(_emit(R13, ctx, row, warned))
 
             # R18/R19 protective detection moved to protective_syndromes.py.
             # Synthetic rule_results are emitted by _emit_protective_rule_results().
@@ -304,52 +411,46 @@ def evaluate_rules(
             "n_endpoints": organ["n_endpoints"],
         }
         if organ.get("target_organ_flag"):
-            results.append(_emit_organ(RULES[7], organ_ctx))
+            results.append(_emit_organ(R08, organ_ctx, warned))
         if organ["n_domains"] >= 2:
-            results.append(_emit_organ(RULES[8], organ_ctx,
+            results.append(_emit_organ(R09, organ_ctx, warned,
                                        params={"n_endpoints": organ["n_endpoints"],
                                                "n_domains": organ["n_domains"],
                                                "domains": organ["domains"]}))
 
         # R16: Correlated findings
-        organ_findings = [f for f in findings if f.get("organ_system") == organ["organ_system"]]
+        organ_findings = findings_by_organ.get(organ["organ_system"], [])
         if len(organ_findings) >= 2:
-            labels = sorted(set(f.get("endpoint_label", "") for f in organ_findings))[:5]
-            results.append(_emit_organ(RULES[15], {
-                **organ_ctx, "endpoint_labels": ", ".join(labels)
-            }, params={"endpoint_labels": labels}))
+            labels = heapq.nsmallest(5, {f.get("endpoint_label", "") for f in organ_findings})
+            results.append(_emit_organ(R16, organ_ctx, warned,
+                                       params={"endpoint_labels": labels},
+                                       overrides={"endpoint_labels": ", ".join(labels)}))
 
     # NOAEL rules (R14, R15) — with derivation trace (IMP-10)
     for noael_row in noael_summary:
         sex = noael_row["sex"]
+        derivation = noael_row.get("noael_derivation")
         if noael_row["noael_dose_level"] is not None:
-            noael_params = {
+            # Read once; shared by the template context and the params
+            noael_dose = {
                 "noael_label": noael_row["noael_label"],
                 "noael_dose_value": noael_row.get("noael_dose_value", ""),
                 "noael_dose_unit": noael_row.get("noael_dose_unit", ""),
-                "noael_derivation": noael_row.get("noael_derivation"),
             }
-            results.append(_emit_study(RULES[13], {
-                "sex": sex,
-                "noael_label": noael_row["noael_label"],
-                "noael_dose_value": noael_row.get("noael_dose_value", ""),
-                "noael_dose_unit": noael_row.get("noael_dose_unit", ""),
-            }, params=noael_params))
+            results.append(_emit_study(R14, {"sex": sex, **noael_dose}, warned,
+                                       params={**noael_dose, "noael_derivation": derivation}))
         else:
-            noael_params_ne = {
-                "noael_derivation": noael_row.get("noael_derivation"),
-            }
-            results.append(_emit_study(RULES[14], {"sex": sex}, params=noael_params_ne))
+            results.append(_emit_study(R15, {"sex": sex}, warned,
+                                       params={"noael_derivation": derivation}))
 
     # R17: Mortality signal (DS domain)
-    for finding in findings:
-        if finding.get("domain") == "DS" and finding.get("test_code") == "MORTALITY":
-            count = finding.get("mortality_count", 0)
-            if count > 0:
-                results.append(_emit_study(RULES[16], {
-                    "sex": finding.get("sex", ""),
-                    "count": count,
-                }, params={"count": count}))
+    for finding in mortality_findings:
+        count = finding.get("mortality_count", 0)
+        if count > 0:
+            results.append(_emit_study(R17, {
+                "sex": finding.get("sex", ""),
+                "count": count,
+            }, warned, params={"count": count}))
 
     # Emit synthetic R18/R19 rule_results from protective syndrome matches
     if protective_syndromes:
@@ -367,25 +468,28 @@ def _apply_suppressions(results: list[dict]) -> list[dict]:
     - R01 present → suppress R07 (treatment significance subsumes pattern diagnostic)
     - R04 present → suppress R01, R03 (adverse classification subsumes trend tests)
     """
+    for r in results:
+        if r["rule_id"] in _SUPPRESSES:
+            break
+    else:
+        return results  # no trigger rule fired, nothing to suppress
+
     by_context = defaultdict(list)
     for r in results:
         by_context[r["context_key"]].append(r)
 
-    suppressed_indices = set()
     for ctx_rules in by_context.values():
         ids = {r["rule_id"] for r in ctx_rules}
-
-        if "R01" in ids and "R07" in ids:
-            for r in ctx_rules:
-                if r["rule_id"] == "R07":
-                    suppressed_indices.add(id(r))
-
-        if "R04" in ids:
+        victims = set()
+        for trigger, suppressed in _SUPPRESSES.items():
+            if trigger in ids:
+                victims |= suppressed
+        if victims:
             for r in ctx_rules:
-                if r["rule_id"] in ("R01", "R03"):
-                    suppressed_indices.add(id(r))
+                if r["rule_id"] in victims:
+                    r["_suppressed"] = True
 
-    return [r for r in results if id(r) not in suppressed_indices]
+    return [r for r in results if not r.get("_suppressed")]
 
 
 def _build_finding_context(finding: dict, dose_label_map: dict) -> dict:
@@ -409,94 +513,107 @@ def _build_finding_context(finding: dict, dose_label_map: dict) -> dict:
     }
 
 
-def _emit(rule: dict, ctx: dict, finding: dict, params=None) -> dict:
-    """Emit a rule result for an endpoint-scoped rule."""
+def _render(rule: Rule, ctx, warned: set[str]) -> str:
+    """Render a rule's text, falling back to the raw template on error.
+
+    A failing template is logged once per rule id in *warned* (one set per
+    evaluate_rules call); later failures of the same rule fall back
+    silently instead of logging per finding.
+    """
     try:
-        text = rule["template"].format(**ctx)
+        return rule.render(ctx)
     except (KeyError, ValueError) as e:
-        logger.warning("Template error in rule %s: %s", rule["id"], e)
-        text = rule["template"]
+        if rule.id not in warned:
+            warned.add(rule.id)
+            logger.warning("Template error in rule %s: %s", rule.id, e)
+        return rule.template
 
-    # Base params — available for all endpoint-scoped rules
-    gs = finding.get("group_stats", [])
-    n_affected_treated = sum(g.get("affected", 0) for g in gs if g.get("dose_level", 0) > 0)
-    max_n = max((g.get("n", 0) for g in gs), default=0)
 
+def _finding_row(finding: dict, n_affected_treated: int, max_n: int) -> tuple:
+    """Per-finding output fields shared by every endpoint rule it fires.
+
+    Returns (context_key, organ_system, evidence_ref, base_params), read
+    from the finding once instead of on every _emit.
+    """
+    fget = finding.get
+    domain = fget("domain")
+    sex = fget("sex")
     base = {
-        "endpoint_label": finding.get("endpoint_label", ""),
-        "domain": finding.get("domain", ""),
-        "test_code": finding.get("test_code", ""),
-        "sex": finding.get("sex", ""),
-        "direction": finding.get("direction", ""),
-        "specimen": finding.get("specimen"),
-        "finding": finding.get("finding", ""),
-        "data_type": finding.get("data_type", ""),
-        "dose_response_pattern": finding.get("dose_response_pattern", ""),
-        "severity_class": finding.get("severity", ""),
-        "treatment_related": finding.get("treatment_related", False),
-        "p_value": finding.get("min_p_adj"),
-        "trend_p": finding.get("trend_p"),
-        "effect_size": finding.get("max_effect_size") or finding.get("avg_severity"),
+        "endpoint_label": fget("endpoint_label", ""),
+        "domain": fget("domain", ""),
+        "test_code": fget("test_code", ""),
+        "sex": fget("sex", ""),
+        "direction": fget("direction", ""),
+        "specimen": fget("specimen"),
+        "finding": fget("finding", ""),
+        "data_type": fget("data_type", ""),
+        "dose_response_pattern": fget("dose_response_pattern", ""),
+        "severity_class": fget("severity", ""),
+        "treatment_related": fget("treatment_related", False),
+        "p_value": fget("min_p_adj"),
+        "trend_p": fget("trend_p"),
+        "effect_size": fget("max_effect_size") or fget("avg_severity"),
         "n_affected": n_affected_treated,
         "max_n": max_n,
     }
-    merged = {**base, **(params or {})}
-
-    return {
-        "rule_id": rule["id"],
-        "scope": rule["scope"],
-        "severity": rule["severity"],
-        "context_key": f"{finding.get('domain')}_{finding.get('test_code')}_{finding.get('sex')}",
-        "organ_system": finding.get("organ_system", ""),
-        "output_text": text,
-        "evidence_refs": [
-            f"{finding.get('domain')}: {finding.get('endpoint_label', '')} ({finding.get('sex', '')})"
-        ],
-        "params": merged,
-    }
-
-
-def _emit_organ(rule: dict, ctx: dict, params=None) -> dict:
+    return (
+        f"{domain}_{fget('test_code')}_{sex}",
+        fget("organ_system", ""),
+        f"{domain}: {base['endpoint_label']} ({base['sex']})",
+        base,
+    )
+
+
+def _emit(
+    rule: Rule, ctx: dict, row: tuple, warned: set[str], params=None, overrides=None,
+) -> dict:
+    """Emit a rule result for an endpoint-scoped rule.
+
+    row is the finding's _finding_row(), built once per finding by the
+    caller. overrides layers per-hit template values (pairwise p, effect
+    size, ...) over ctx without copying it.
+    """
+    text = _render(rule, ChainMap(overrides, ctx) if overrides else ctx, warned)
+    context_key, organ_system, evidence_ref, base = row
+
+    out = rule.result_template.copy()
+    out["context_key"] = context_key
+    out["organ_system"] = organ_system
+    out["output_text"] = text
+    out["evidence_refs"] = [evidence_ref]
+    # Base params (available for all endpoint-scoped rules) + rule params
+    out["params"] = {**base, **params} if params else base.copy()
+    return out
+
+
+def _emit_organ(
+    rule: Rule, ctx: dict, warned: set[str], params=None, overrides=None,
+) -> dict:
     """Emit a rule result for an organ-scoped rule."""
-    try:
-        text = rule["template"].format(**ctx)
-    except (KeyError, ValueError) as e:
-        logger.warning("Template error in rule %s: %s", rule["id"], e)
-        text = rule["template"]
+    text = _render(rule, ChainMap(overrides, ctx) if overrides else ctx, warned)
 
     base = {"organ_system": ctx.get("organ_system", "")}
     merged = {**base, **(params or {})}
 
-    return {
-        "rule_id": rule["id"],
-        "scope": rule["scope"],
-        "severity": rule["severity"],
-        "context_key": f"organ_{ctx.get('organ_system', '')}",
-        "organ_system": ctx.get("organ_system", ""),
-        "output_text": text,
-        "evidence_refs": [],
-        "params": merged,
-    }
+    out = rule.result_template.copy()
+    out["context_key"] = f"organ_{ctx.get('organ_system', '')}"
+    out["organ_system"] = ctx.get("organ_system", "")
+    out["output_text"] = text
+    out["evidence_refs"] = []
+    out["params"] = merged
+    return out
 
 
-def _emit_study(rule: dict, ctx: dict, params=None) -> dict:
+def _emit_study(rule: Rule, ctx: dict, warned: set[str], params=None) -> dict:
     """Emit a rule result for a study-scoped rule."""
-    try:
-        text = rule["template"].format(**ctx)
-    except (KeyError, ValueError) as e:
-        logger.warning("Template error in rule %s: %s", rule["id"], e)
-        text = rule["template"]
+    text = _render(rule, ctx, warned)
 
     base = {"sex": ctx.get("sex", "")}
     merged = {**base, **(params or {})}
 
-    return {
-        "rule_id": rule["id"],
-        "scope": rule["scope"],
-        "severity": rule["severity"],
-        "context_key": f"study_{ctx.get('sex', 'Combined')}",
-        "organ_system": "",
-        "output_text": text,
-        "evidence_refs": [],
-        "params": merged,
-    }
+    out = rule.result_template.copy()
+    out["context_key"] = f"study_{ctx.get('sex', 'Combined')}"
+    out["output_text"] = text
+    out["evidence_refs"] = []
+    out["params"] = merged
+    return out
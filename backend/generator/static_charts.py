@@ -5,6 +5,42 @@ in the frontend via dangerouslySetInnerHTML.
 """
 
 import html
+from functools import lru_cache
+
+# Per-organ bar row and chart wrapper, filled with str.format_map per call
+_ROW_TMPL = """
+        <div style="display:flex;align-items:center;gap:8px;margin-bottom:6px;">
+          <div style="width:120px;text-align:right;font-size:12px;color:#374151;font-weight:500;flex-shrink:0;">
+            {organ_name}{flag}
+          </div>
+          <div style="flex:1;background:#f3f4f6;border-radius:4px;height:22px;position:relative;overflow:hidden;">
+            <div style="width:{pct:.1f}%;background:{bar_color};height:100%;border-radius:4px;transition:width 0.3s;"></div>
+            <span style="position:absolute;right:6px;top:3px;font-size:10px;color:#6b7280;">
+              {score:.2f}
+            </span>
+          </div>
+          <div style="width:140px;font-size:10px;color:#9ca3af;flex-shrink:0;">
+            {detail}
+          </div>
+        </div>"""
+
+_CHART_TMPL = """<div style="font-family:system-ui,-apple-system,sans-serif;padding:12px 0;">
+  <div style="font-size:13px;font-weight:600;color:#1f2937;margin-bottom:12px;">
+    Target Organ Evidence Scores
+  </div>
+  <div style="font-size:10px;color:#9ca3af;margin-bottom:8px;">
+    Threshold for target organ designation: {threshold} &nbsp;|&nbsp;
+    <span style="color:{bar_color};">&#9632;</span> Above threshold &nbsp;
+    <span style="color:#22c55e;">&#9632;</span> Below threshold
+  </div>
+  {rows}
+</div>"""
+
+
+@lru_cache(maxsize=256)
+def _pretty_organ(name: str) -> str:
+    """Display label for an organ_system key (memoized; the vocabulary is small)."""
+    return html.escape(name.replace("_", " ").title())
 
 
 def generate_target_organ_bar_chart(target_organs: list[dict]) -> str:
@@ -41,33 +77,20 @@ def generate_target_organ_bar_chart(target_organs: list[dict]) -> str:
         # Flag indicator
         flag = " *" if organ.get("target_organ_flag") else ""
 
-        organ_name = html.escape(organ["organ_system"].replace("_", " ").title())
+        organ_name = _pretty_organ(organ["organ_system"])
         detail = f"{organ['n_endpoints']} endpoints, {organ['n_domains']} domains"
 
-        rows_html.append(f"""
-        <div style="display:flex;align-items:center;gap:8px;margin-bottom:6px;">
-          <div style="width:120px;text-align:right;font-size:12px;color:#374151;font-weight:500;flex-shrink:0;">
-            {organ_name}{flag}
-          </div>
-          <div style="flex:1;background:#f3f4f6;border-radius:4px;height:22px;position:relative;overflow:hidden;">
-            <div style="width:{pct:.1f}%;background:{bar_color};height:100%;border-radius:4px;transition:width 0.3s;"></div>
-            <span style="position:absolute;right:6px;top:3px;font-size:10px;color:#6b7280;">
-              {score:.2f}
-            </span>
-          </div>
-          <div style="width:140px;font-size:10px;color:#9ca3af;flex-shrink:0;">
-            {detail}
-          </div>
-        </div>""")
+        rows_html.append(_ROW_TMPL.format_map({
+            "organ_name": organ_name,
+            "flag": flag,
+            "pct": pct,
+            "bar_color": bar_color,
+            "score": score,
+            "detail": detail,
+        }))
 
-    return f"""<div style="font-family:system-ui,-apple-system,sans-serif;padding:12px 0;">
-  <div style="font-size:13px;font-weight:600;color:#1f2937;margin-bottom:12px;">
-    Target Organ Evidence Scores
-  </div>
-  <div style="font-size:10px;color:#9ca3af;margin-bottom:8px;">
-    Threshold for target organ designation: {threshold} &nbsp;|&nbsp;
-    <span style="color:{bar_color};">&#9632;</span> Above threshold &nbsp;
-    <span style="color:#22c55e;">&#9632;</span> Below threshold
-  </div>
-  {"".join(rows_html)}
-</div>"""
+    return _CHART_TMPL.format_map({
+        "threshold": threshold,
+        "bar_color": bar_color,
+        "rows": "".join(rows_html),
+    })
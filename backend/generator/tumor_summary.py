@@ -9,6 +9,7 @@ Haseman dual-threshold significance, and HCD tumor background rates.
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 
 import pandas as pd
 
@@ -113,37 +114,33 @@ def build_tumor_summary(
 
     # Build per-organ+morphology summaries from neoplastic findings
     summaries = []
-    all_tumor_animals: set[str] = set()
 
     for f in neoplastic_findings:
-        organ = f.get("specimen", "")
-        morphology = f.get("finding", "")
-        behavior = f.get("behavior", "UNCERTAIN")
-        cell_type = f.get("cell_type", _extract_cell_type(morphology))
-        sex = f.get("sex", "")
+        fget = f.get
+        morphology = fget("finding", "")
+        # Only derive the cell type when the finding does not carry one
+        cell_type = f["cell_type"] if "cell_type" in f else _extract_cell_type(morphology)
 
         # Count affected animals per dose from group_stats
-        by_dose = []
-        total_affected = 0
-        for gs in f.get("group_stats", []):
-            affected = gs.get("affected", 0)
-            total_affected += affected
-            by_dose.append({
+        by_dose = [
+            {
                 "dose_level": gs["dose_level"],
                 "n": gs.get("n", 0),
-                "affected": affected,
+                "affected": gs.get("affected", 0),
                 "incidence": gs.get("incidence", 0),
-            })
+            }
+            for gs in fget("group_stats", [])
+        ]
 
         summaries.append({
-            "organ": organ,
+            "organ": fget("specimen", ""),
             "morphology": morphology,
-            "behavior": behavior,
+            "behavior": fget("behavior", "UNCERTAIN"),
             "cell_type": cell_type,
-            "sex": sex,
-            "count": total_affected,
+            "sex": fget("sex", ""),
+            "count": sum(d["affected"] for d in by_dose),
             "by_dose": by_dose,
-            "trend_p": f.get("trend_p"),
+            "trend_p": fget("trend_p"),
         })
 
     # Count unique tumor animals from raw MI + TF data
@@ -202,7 +199,8 @@ def _count_tumor_animals(study: StudyInfo) -> set[str]:
     # TF domain: all records are neoplastic
     if "tf" in study.xpt_files:
         try:
-            tf_df, _ = read_xpt(study.xpt_files["tf"])
+            # Only the subject IDs are needed; skip decoding the rest
+            tf_df, _ = read_xpt(study.xpt_files["tf"], columns=["USUBJID"])
             tf_df.columns = [c.upper() for c in tf_df.columns]
             if "USUBJID" in tf_df.columns:
                 animals.update(str(u) for u in tf_df["USUBJID"].unique())
@@ -632,40 +630,36 @@ def _compute_parallel_analyses(
 
     Replaces _compute_combined_analyses with full poly-3, Haseman, and discordance.
     """
-    # Group by (organ, cell_type, sex)
+    # Group by (organ, cell_type, sex), noting each behavior's first
+    # morphology in the same pass (HCD lookup hints)
     groups: dict[tuple[str, str, str], list[dict]] = {}
+    behavior_morphs: dict[tuple[str, str, str], dict[str, str]] = {}
     for f in neoplastic_findings:
-        organ = f.get("specimen", "")
         cell_type = f.get("cell_type", "unclassified")
-        sex = f.get("sex", "")
-        key = (organ, cell_type, sex)
+        if cell_type == "unclassified":
+            continue
+        key = (f.get("specimen", ""), cell_type, f.get("sex", ""))
         groups.setdefault(key, []).append(f)
+        behavior_morphs.setdefault(key, {}).setdefault(f.get("behavior"), f.get("finding", ""))
 
     results = []
     for (organ, cell_type, sex), group in groups.items():
-        if len(group) < 2 or cell_type == "unclassified":
+        if len(group) < 2:
             continue
 
         # Get a morphology hint for HCD lookup (from first finding)
         morph_hint = group[0].get("finding", "")
+        morphs = behavior_morphs[(organ, cell_type, sex)]
 
         # Adenoma analysis (BENIGN)
-        adenoma_morph = ""
-        for f in group:
-            if f.get("behavior") == "BENIGN":
-                adenoma_morph = f.get("finding", "")
-                break
+        adenoma_morph = morphs.get("BENIGN", "")
         adenoma = _run_analysis(
             "BENIGN", group, animal_tumor_index, organ, cell_type, sex,
             survival_data, study_duration, strain, morphology_hint=adenoma_morph or morph_hint,
         )
 
         # Carcinoma analysis (MALIGNANT)
-        carcinoma_morph = ""
-        for f in group:
-            if f.get("behavior") == "MALIGNANT":
-                carcinoma_morph = f.get("finding", "")
-                break
+        carcinoma_morph = morphs.get("MALIGNANT", "")
         carcinoma = _run_analysis(
             "MALIGNANT", group, animal_tumor_index, organ, cell_type, sex,
             survival_data, study_duration, strain, morphology_hint=carcinoma_morph or morph_hint,
@@ -707,24 +701,30 @@ def _detect_progressions(
 ) -> list[dict]:
     """Detect proliferative progression sequences by cross-referencing neoplastic and MI."""
     # Collect organs with neoplastic tumors
-    tf_organs: dict[str, dict[str, list[str]]] = {}  # organ -> {cell_type -> [stages]}
+    # organ -> {cell_type -> {stages}}
+    tf_organs: dict[str, dict[str, set[str]]] = defaultdict(lambda: defaultdict(set))
     for f in neoplastic_findings:
         organ = f.get("specimen", "").upper()
         cell_type = f.get("cell_type", "unclassified")
+        # Register the organ first so output order follows first appearance
+        cell_types = tf_organs[organ]
+        # Only cell types with a defined sequence can yield a progression
+        if cell_type not in PROGRESSION_SEQUENCES:
+            continue
         morphology = f.get("finding", "")
         stages = _match_stage(morphology, TF_STAGE_TERMS)
-        tf_organs.setdefault(organ, {}).setdefault(cell_type, []).extend(stages)
+        cell_types[cell_type].update(stages)
 
     # Collect MI precursors per organ
-    mi_stages_by_organ: dict[str, list[str]] = {}  # organ -> [stages]
-    mi_precursors_by_organ: dict[str, list[dict]] = {}  # organ -> [finding details]
+    mi_stages_by_organ: dict[str, set[str]] = defaultdict(set)  # organ -> {stages}
+    mi_precursors_by_organ: dict[str, list[dict]] = defaultdict(list)  # organ -> [finding details]
     for f in mi_precursor_findings:
         organ = f.get("specimen", "").upper()
         finding_text = f.get("finding", "")
         stages = _match_stage(finding_text, MI_PRECURSOR_TERMS)
         if stages:
-            mi_stages_by_organ.setdefault(organ, []).extend(stages)
-            mi_precursors_by_organ.setdefault(organ, []).append({
+            mi_stages_by_organ[organ].update(stages)
+            mi_precursors_by_organ[organ].append({
                 "finding": finding_text,
                 "stages_matched": stages,
                 "specimen": f.get("specimen", ""),
@@ -741,15 +741,15 @@ def _detect_progressions(
                 continue
 
             # Combine MI stages + TF stages
-            mi_stages = set(mi_stages_by_organ.get(organ, []))
-            all_stages_present = list(set(tf_stages) | mi_stages)
+            mi_stages = mi_stages_by_organ.get(organ, set())
+            all_stages_present = tf_stages | mi_stages
 
             # Check which defined stages are present
             stages_present = [s for s in sequence_def if s in all_stages_present]
 
             # Need at least one MI precursor and one TF tumor stage
-            has_mi = any(s in mi_stages for s in stages_present)
-            has_tf = any(s in tf_stages for s in stages_present)
+            has_mi = not mi_stages.isdisjoint(stages_present)
+            has_tf = not tf_stages.isdisjoint(stages_present)
 
             if not stages_present:
                 continue
@@ -779,15 +779,19 @@ def _parse_pm(study: StudyInfo) -> list[dict]:
     except Exception:
         return []
 
-    masses = []
-    for _, row in pm_df.iterrows():
-        animal_id = str(row.get("USUBJID", ""))
-        location = str(row.get("PMLOC", row.get("PMSPEC", "")))
-        # Try to get dose level from DM merge, but PM is metadata-only
-        masses.append({
-            "animal_id": animal_id,
-            "location": location,
-            "finding": str(row.get("PMSTRESC", row.get("PMORRES", "MASS"))),
-        })
-
-    return masses
+    def _column(preferred: str, fallback: str | None, default: str) -> list[str]:
+        # First present column wins, as row.get(preferred, row.get(fallback)) did
+        for name in (preferred, fallback):
+            if name in pm_df.columns:
+                return [str(v) for v in pm_df[name].tolist()]
+        return [default] * len(pm_df)
+
+    # PM is metadata-only; no dose level is attached
+    return [
+        {"animal_id": animal_id, "location": location, "finding": finding}
+        for animal_id, location, finding in zip(
+            _column("USUBJID", None, ""),
+            _column("PMLOC", "PMSPEC", ""),
+            _column("PMSTRESC", "PMORRES", "MASS"),
+        )
+    ]
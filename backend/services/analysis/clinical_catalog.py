@@ -89,6 +89,14 @@ def match_catalog(params: dict) -> dict | None:
     return None
 
 
+def _match_catalog_memo(params: dict, memo: dict[tuple, dict | None]) -> dict | None:
+    """match_catalog() memoized in *memo* on the only params it reads."""
+    key = (params.get("specimen"), params.get("finding"))
+    if key not in memo:
+        memo[key] = match_catalog(params)
+    return memo[key]
+
+
 # ---------------------------------------------------------------------------
 # Confidence computation
 # ---------------------------------------------------------------------------
@@ -305,6 +313,10 @@ def apply_clinical_layer(
         except Exception as exc:  # pragma: no cover -- defensive
             logger.warning("HCD wiring unavailable: %s", exc)
 
+    # Every endpoint rule emitted for a finding carries the same
+    # specimen/finding params, so match each pair against the catalog once.
+    catalog_matches: dict[tuple, dict | None] = {}
+
     for result in results:
         params = result.get("params", {})
         rule_id = result.get("rule_id", "")
@@ -314,7 +326,7 @@ def apply_clinical_layer(
             continue
 
         # Try to match against catalog
-        catalog_match = match_catalog(params)
+        catalog_match = _match_catalog_memo(params, catalog_matches)
 
         # --- R18/R19: Check protective exclusions ---
         # NOTE: This call omits rule_id and study_context intentionally.
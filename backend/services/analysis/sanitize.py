@@ -8,6 +8,11 @@ import math
 
 import numpy as np
 
+# Exact types that never need conversion. Checked with ``type(obj) in`` so
+# already-native atoms skip the isinstance chain (np.float64 subclasses
+# float and is not an exact match).
+_NATIVE_ATOMS = frozenset({str, int, bool, type(None)})
+
 
 def sanitize(obj):
     """Replace NaN/Inf with None, convert numpy types to Python natives.
@@ -15,19 +20,19 @@ def sanitize(obj):
     Handles: np.integer, np.bool_, np.floating, np.ndarray, float,
     dict, list, tuple, set. Returns input unchanged for other types.
     """
-    if isinstance(obj, (np.integer,)):
-        return int(obj)
-    if isinstance(obj, (np.bool_,)):
-        return bool(obj)
+    if type(obj) in _NATIVE_ATOMS:
+        return obj
+    if isinstance(obj, dict):
+        return {k: sanitize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [sanitize(v) for v in obj]
     if isinstance(obj, (float, np.floating)):
         val = float(obj)
         return None if (math.isnan(val) or math.isinf(val)) else val
+    if isinstance(obj, (np.integer, np.bool_)):
+        return obj.item()
     if isinstance(obj, np.ndarray):
         return sanitize(obj.tolist())
-    if isinstance(obj, dict):
-        return {k: sanitize(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [sanitize(v) for v in obj]
     if isinstance(obj, set):
         return sorted(sanitize(v) for v in obj)
     return obj
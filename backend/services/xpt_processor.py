@@ -35,19 +35,44 @@ def _zero_subnormals(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def read_xpt(xpt_path: Path) -> tuple[pd.DataFrame, pyreadstat.metadata_container]:
+def _read_xport(
+    xpt_path: Path, **kwargs,
+) -> tuple[pd.DataFrame, pyreadstat.metadata_container]:
     try:
-        df, meta = pyreadstat.read_xport(str(xpt_path))
+        return pyreadstat.read_xport(str(xpt_path), **kwargs)
     except Exception:
         # Retry with encoding fallback chain for non-ASCII XPT files
         for enc in ("cp1252", "iso-8859-1"):
             try:
-                df, meta = pyreadstat.read_xport(str(xpt_path), encoding=enc)
-                break
+                return pyreadstat.read_xport(str(xpt_path), encoding=enc, **kwargs)
             except Exception:
                 continue
-        else:
-            raise
+        raise
+
+
+def read_xpt_columns(xpt_path: Path) -> list[str]:
+    """Return the variable names of an XPT file from its header only."""
+    _, header = _read_xport(xpt_path, metadataonly=True)
+    return header.column_names
+
+
+def read_xpt(
+    xpt_path: Path,
+    columns: list[str] | None = None,
+) -> tuple[pd.DataFrame, pyreadstat.metadata_container]:
+    """Read an XPT file into a DataFrame.
+
+    When columns is given, only those variables are decoded (matched
+    case-insensitively; names absent from the file are ignored). Column
+    names keep the file's casing, so callers still upper-case as usual.
+    """
+    kwargs = {}
+    if columns is not None:
+        wanted = {c.upper() for c in columns}
+        kwargs["usecols"] = [
+            c for c in read_xpt_columns(xpt_path) if c.upper() in wanted
+        ]
+    df, meta = _read_xport(xpt_path, **kwargs)
     df = _zero_subnormals(df)
     return df, meta
 
@@ -130,6 +130,34 @@ def test_food_consumption_json_output():
     print("  food_consumption_summary.json validated")
 
 
+def test_read_xpt_column_projection():
+    """read_xpt(columns=...) decodes only the requested FW variables."""
+    from services.xpt_processor import read_xpt
+
+    study = get_pointcross_study()
+    full, _ = read_xpt(study.xpt_files["fw"])
+    # Lower-case request and an absent variable: matched case-insensitively,
+    # absent ignored
+    proj, _ = read_xpt(
+        study.xpt_files["fw"], columns=["usubjid", "FWSTRESN", "FWENDY", "NOTAVAR"],
+    )
+
+    wanted = {"USUBJID", "FWSTRESN", "FWENDY"}
+    assert list(proj.columns) == [c for c in full.columns if c in wanted]
+    assert len(proj) == len(full)
+    assert proj["FWSTRESN"].equals(full["FWSTRESN"])
+
+
+def test_read_xpt_columns_matches_full_read():
+    """read_xpt_columns() reads the header only but lists the same variables."""
+    from services.xpt_processor import read_xpt, read_xpt_columns
+
+    study = get_pointcross_study()
+    for domain in ("fw", "dm", "pp"):
+        full, _ = read_xpt(study.xpt_files[domain])
+        assert read_xpt_columns(study.xpt_files[domain]) == list(full.columns)
+
+
 if __name__ == "__main__":
     print("Running food efficiency tests against PointCross...")
     test_food_consumption_summary()
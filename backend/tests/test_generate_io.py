@@ -0,0 +1,63 @@
+"""Unit tests for the generate.py batch entry point and output helpers.
+
+These run without a SEND study on disk: `generate` itself is stubbed, and
+the records helper is exercised on small synthetic frames.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from generator import generate as gen
+
+
+def _fake_generate(study_id: str):
+    """Stand-in for generate(): 'BAD' exits the way a missing study does."""
+    if study_id == "BAD":
+        sys.exit(1)
+
+
+def _no_preimport():
+    pass
+
+
+def test_generate_many_reports_failed_ids(monkeypatch):
+    monkeypatch.setattr(gen, "generate", _fake_generate)
+    monkeypatch.setattr(gen, "_preimport", _no_preimport)
+    assert gen.generate_many(["GOOD", "BAD"], max_workers=2) == ["BAD"]
+
+
+def _typed(rows: list[dict]) -> list[dict]:
+    """Rows with each value tagged by type; NaN mapped to a comparable marker."""
+    return [
+        {k: "NaN" if isinstance(v, float) and math.isnan(v) else (type(v), v)
+         for k, v in row.items()}
+        for row in rows
+    ]
+
+
+@pytest.mark.parametrize("df", [
+    # Arrow path: numeric, bool, string and single-type object columns
+    pd.DataFrame({
+        "USUBJID": pd.Series(["S1", "S2", "S3"], dtype="str"),
+        "n": np.array([1, 2, 3], dtype="int64"),
+        "x": [1.5, np.nan, 3.0],
+        "flag": [True, False, True],
+        "start_dy": pd.Series([18, None, 18], dtype=object),
+    }),
+    # Fallback: NaN-holding string column, dicts, mixed int/float objects
+    pd.DataFrame({
+        "note": [None, "a", None],
+        "d": pd.Series([{"x": 1}, {"y": 2}, {}], dtype=object),
+        "m": pd.Series([1, 2.5, None], dtype=object),
+    }),
+])
+def test_frame_records_matches_to_dict(df):
+    assert _typed(gen._frame_records(df)) == _typed(df.to_dict(orient="records"))
+